@@ -5,15 +5,62 @@ Datenmodelle und SQLite-Schema für GF-Screening Pipeline.
 import csv
 import logging
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, List
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, List, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# BOOLEAN-Spalten kommen direkt als bool zurück (NULL bleibt None, der
+# Converter wird dafür nicht aufgerufen).
+sqlite3.register_converter("BOOLEAN", lambda value: value != b"0")
+# bool ist keine exakte int-Instanz; ohne registrierten Adapter sucht sqlite3
+# bei jedem Binden erst vergeblich nach __adapt__/__conform__.
+sqlite3.register_adapter(bool, int)
 
-@dataclass
+MAX_QUERY_LIMIT = 10000
+
+# (company_id, natural_count, legal_count, confidence, shareholders)
+ParsingUpdate = Tuple[int, int, int, float, List["Shareholder"]]
+
+
+def _validate_limit(limit: int) -> int:
+    """Prüft einen LIMIT-Wert.
+
+    Der Typ wird vor dem gecachten Bereichs-Check geprüft, damit auch
+    nicht hashbare Werte (z.B. ``[1]``) einen ValueError auslösen.
+
+    Raises:
+        ValueError: Wenn limit kein positiver Integer oder > MAX_QUERY_LIMIT.
+    """
+    if not isinstance(limit, int):
+        raise ValueError(f"Invalid limit: {limit}. Must be positive integer.")
+    return _validate_int_limit(limit)
+
+
+@lru_cache(maxsize=128)
+def _validate_int_limit(limit: int) -> int:
+    """Bereichs-Check für _validate_limit; gültige Werte werden gecacht."""
+    if limit < 1:
+        raise ValueError(f"Invalid limit: {limit}. Must be positive integer.")
+    if limit > MAX_QUERY_LIMIT:
+        raise ValueError(f"Limit {limit} exceeds maximum of {MAX_QUERY_LIMIT}.")
+    return limit
+
+
+@lru_cache(maxsize=32)
+def _with_limit_clause(base_query: str) -> str:
+    """Liefert die parametrisierte LIMIT-Variante einer Abfrage.
+
+    Der identische String sorgt für Treffer im Statement-Cache von sqlite3.
+    """
+    return base_query + " LIMIT ?"
+
+
+@dataclass(slots=True)
 class Company:
     """Firma aus Dealfront-Import."""
     id: Optional[int] = None
@@ -39,7 +86,7 @@ class Company:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Shareholder:
     """Gesellschafter einer Firma."""
     id: Optional[int] = None
@@ -52,7 +99,12 @@ class Shareholder:
 
 
 class Database:
-    """SQLite-Datenbank für Pipeline-State."""
+    """SQLite-Datenbank für Pipeline-State.
+
+    Schreibzugriffe laufen über ``conn`` (Autocommit, explizite
+    ``BEGIN IMMEDIATE``-Transaktionen), Abfragen über die schreibgeschützte
+    ``ro_conn``. Im WAL-Modus blockieren sich beide nicht gegenseitig.
+    """
 
     SCHEMA = """
     CREATE TABLE IF NOT EXISTS companies (
@@ -97,35 +149,156 @@ class Database:
         message TEXT,
         created_at DATETIME DEFAULT CURRENT_TIMESTAMP
     );
+    """
 
+    # Sekundärindizes; werden von bulk_load() temporär entfernt
+    INDEXES = """
     CREATE INDEX IF NOT EXISTS idx_companies_qualified ON companies(is_qualified);
     CREATE INDEX IF NOT EXISTS idx_companies_pipeline ON companies(dk_downloaded, pdf_parsed);
     CREATE INDEX IF NOT EXISTS idx_shareholders_company ON shareholders(company_id);
+
+    -- Partieller Index: enthält nur noch herunterzuladende Firmen
+    CREATE INDEX IF NOT EXISTS idx_pending_dl ON companies(dk_downloaded, register_num)
+        WHERE dk_downloaded = FALSE AND register_num != '';
+    """
+
+    # Spalten in Deklarationsreihenfolge von Company (ohne Zeitstempel),
+    # damit Ergebniszeilen direkt per Company(*row) gebaut werden können.
+    COMPANY_COLUMNS = """
+        id, COALESCE(dealfront_id, ''), name, COALESCE(city, ''),
+        COALESCE(court, ''), COALESCE(register_type, ''), COALESCE(register_num, ''),
+        dk_downloaded, pdf_parsed, pdf_path,
+        natural_persons_count, legal_entities_count, parsing_confidence, is_qualified
+    """
+
+    UPDATE_PARSING_SQL = """
+        UPDATE companies SET
+            pdf_parsed = TRUE,
+            natural_persons_count = :natural,
+            legal_entities_count = :legal,
+            parsing_confidence = :confidence,
+            is_qualified = (:natural <= 2 AND :legal = 0),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = :id
+    """
+
+    INSERT_SHAREHOLDER_SQL = """
+        INSERT INTO shareholders (company_id, name, share_percent, is_natural_person, source)
+        VALUES (?, ?, ?, ?, ?)
+    """
+
+    INSERT_LOG_SQL = """
+        INSERT INTO pipeline_log (company_id, stage, status, message)
+        VALUES (?, ?, ?, ?)
+    """
+
+    # Gepufferte Log-Events werden ab dieser Anzahl gesammelt geschrieben
+    LOG_FLUSH_THRESHOLD = 128
+
+    # Zeilen pro fetchmany()-Aufruf beim CSV-Export
+    EXPORT_BATCH_SIZE = 1000
+
+    INSERT_COMPANY_SQL = """
+        INSERT OR IGNORE INTO companies
+        (dealfront_id, name, city, court, register_type, register_num)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    # Alle Kennzahlen in einem einzigen Durchlauf über companies
+    STATS_SQL = """
+        SELECT
+            COUNT(*) AS total,
+            COUNT(CASE WHEN dk_downloaded = TRUE THEN 1 END) AS downloaded,
+            COUNT(CASE WHEN pdf_parsed = TRUE THEN 1 END) AS parsed,
+            COUNT(CASE WHEN is_qualified = TRUE THEN 1 END) AS qualified,
+            COUNT(CASE WHEN dk_downloaded = TRUE AND pdf_path IS NULL THEN 1 END) AS no_gl
+        FROM companies
     """
 
     def __init__(self, db_path: str = "data/gesellschafter.db") -> None:
+        """Öffnet (oder erstellt) die Datenbank.
+
+        Args:
+            db_path: Pfad zur SQLite-Datei oder ":memory:" für eine
+                flüchtige In-Memory-Datenbank (z.B. in Tests).
+        """
+        in_memory = str(db_path) == ":memory:"
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(str(self.db_path))
+        if not in_memory:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(
+            str(self.db_path), isolation_level=None,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+        )
         self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
         self._init_schema()
+        self._log_buf: List[tuple] = []
+
+        if in_memory:
+            # Eine In-Memory-DB ist nur über ihre eigene Verbindung sichtbar
+            self.ro_conn = self.conn
+            return
+
+        self.ro_conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+        )
+        self.ro_conn.row_factory = sqlite3.Row
 
     def _init_schema(self) -> None:
-        """Erstellt Tabellen falls nicht vorhanden."""
-        self.conn.executescript(self.SCHEMA)
-        self.conn.commit()
+        """Erstellt Tabellen und Indizes falls nicht vorhanden."""
+        self.conn.executescript(self.SCHEMA + self.INDEXES)
+
+    @contextmanager
+    def bulk_load(self) -> Iterator["Database"]:
+        """Entfernt die Sekundärindizes für die Dauer eines Massenimports.
+
+        Die Inserts müssen so keine Indizes pflegen; nach dem Block werden
+        alle Indizes aus INDEXES in einem Durchgang neu aufgebaut, auch wenn
+        der Import mit einer Exception abbricht. Der UNIQUE-Index für
+        (name, register_num) bleibt erhalten, damit Duplikate weiter
+        erkannt werden.
+
+        Yields:
+            Die Datenbank selbst.
+        """
+        index_names = [
+            row[0] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            )
+        ]
+        for name in index_names:
+            self.conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+        try:
+            yield self
+        finally:
+            self.conn.executescript(self.INDEXES)
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Schreibtransaktion, die den Write-Lock sofort anfordert.
+
+        Yields:
+            Die Schreibverbindung.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
 
     def insert_company(self, company: Company) -> int:
         """Fügt Firma ein und gibt ID zurück."""
-        cursor = self.conn.execute("""
-            INSERT OR IGNORE INTO companies
-            (dealfront_id, name, city, court, register_type, register_num)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            company.dealfront_id, company.name, company.city,
-            company.court, company.register_type, company.register_num
-        ))
-        self.conn.commit()
+        with self._write_transaction() as conn:
+            cursor = conn.execute(self.INSERT_COMPANY_SQL, (
+                company.dealfront_id, company.name, company.city,
+                company.court, company.register_type, company.register_num
+            ))
 
         if cursor.lastrowid == 0:
             # Already exists, get existing ID
@@ -137,6 +310,25 @@ class Database:
 
         return cursor.lastrowid
 
+    def insert_companies(self, companies: Iterable[Company]) -> int:
+        """Fügt mehrere Firmen in einer einzigen Transaktion ein.
+
+        Duplikate (gleicher Name + Registernummer) werden wie bei
+        insert_company ignoriert.
+
+        Args:
+            companies: Einzufügende Firmen.
+
+        Returns:
+            Anzahl tatsächlich eingefügter Firmen.
+        """
+        with self._write_transaction() as conn:
+            cursor = conn.executemany(self.INSERT_COMPANY_SQL, (
+                (c.dealfront_id, c.name, c.city, c.court, c.register_type, c.register_num)
+                for c in companies
+            ))
+        return cursor.rowcount
+
     def _execute_with_limit(self, base_query: str, limit: Optional[int] = None) -> list:
         """Executes query with optional LIMIT clause using parameterized query.
 
@@ -150,111 +342,126 @@ class Database:
         Raises:
             ValueError: Wenn limit kein positiver Integer oder > 10000.
         """
-        params: list = []
-        query: str = base_query
-
-        if limit is not None:
-            if not isinstance(limit, int) or limit < 1:
-                raise ValueError(f"Invalid limit: {limit}. Must be positive integer.")
-            if limit > 10000:
-                raise ValueError(f"Limit {limit} exceeds maximum of 10000.")
-            query += " LIMIT ?"
-            params.append(limit)
+        if limit is None:
+            return self.ro_conn.execute(base_query).fetchall()
 
-        return self.conn.execute(query, params).fetchall()
+        return self.ro_conn.execute(
+            _with_limit_clause(base_query), (_validate_limit(limit),)
+        ).fetchall()
 
     def get_pending_downloads(self, limit: Optional[int] = None) -> List[Company]:
         """Holt Firmen die noch heruntergeladen werden müssen."""
-        query = """
-            SELECT * FROM companies
+        query = f"""
+            SELECT {self.COMPANY_COLUMNS} FROM companies
             WHERE dk_downloaded = FALSE AND register_num IS NOT NULL AND register_num != ''
             ORDER BY id
         """
         rows = self._execute_with_limit(query, limit)
-        return [self._row_to_company(row) for row in rows]
+        return [Company(*row) for row in rows]
 
     def get_pending_parsing(self, limit: Optional[int] = None) -> List[Company]:
         """Holt Firmen die noch geparst werden müssen."""
-        query = """
-            SELECT * FROM companies
+        query = f"""
+            SELECT {self.COMPANY_COLUMNS} FROM companies
             WHERE dk_downloaded = TRUE AND pdf_parsed = FALSE AND pdf_path IS NOT NULL
             ORDER BY id
         """
         rows = self._execute_with_limit(query, limit)
-        return [self._row_to_company(row) for row in rows]
+        return [Company(*row) for row in rows]
 
     def update_download_status(self, company_id: int, pdf_path: Optional[str],
                                success: bool) -> None:
         """Aktualisiert Download-Status."""
-        self.conn.execute("""
-            UPDATE companies SET
-                dk_downloaded = TRUE,
-                pdf_path = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (pdf_path, company_id))
-        self.conn.commit()
+        with self._write_transaction() as conn:
+            conn.execute("""
+                UPDATE companies SET
+                    dk_downloaded = TRUE,
+                    pdf_path = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (pdf_path, company_id))
 
     def update_parsing_result(self, company_id: int, natural_count: int,
                               legal_count: int, confidence: float,
                               shareholders: List[Shareholder]) -> None:
-        """Speichert Parsing-Ergebnis."""
-        is_qualified: bool = natural_count <= 2 and legal_count == 0
-
-        self.conn.execute("""
-            UPDATE companies SET
-                pdf_parsed = TRUE,
-                natural_persons_count = ?,
-                legal_entities_count = ?,
-                parsing_confidence = ?,
-                is_qualified = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (natural_count, legal_count, confidence, is_qualified, company_id))
-
-        # Gesellschafter einfügen
-        for sh in shareholders:
-            self.conn.execute("""
-                INSERT INTO shareholders (company_id, name, share_percent, is_natural_person, source)
-                VALUES (?, ?, ?, ?, ?)
-            """, (company_id, sh.name, sh.share_percent, sh.is_natural_person, sh.source))
-
-        self.conn.commit()
+        """Speichert Parsing-Ergebnis.
+
+        Die Qualifizierung (<= 2 natürliche Personen, keine juristischen)
+        wird direkt im UPDATE berechnet.
+        """
+        self.bulk_update_parsing_results(
+            [(company_id, natural_count, legal_count, confidence, shareholders)]
+        )
+
+    def bulk_update_parsing_results(self, results: Sequence[ParsingUpdate]) -> None:
+        """Speichert mehrere Parsing-Ergebnisse in einer Transaktion.
+
+        Args:
+            results: Tupel aus (company_id, natural_count, legal_count,
+                confidence, shareholders) je Firma.
+        """
+        if not results:
+            return
+
+        with self._write_transaction() as conn:
+            conn.executemany(self.UPDATE_PARSING_SQL, [
+                {"natural": natural, "legal": legal, "confidence": confidence, "id": cid}
+                for cid, natural, legal, confidence, _ in results
+            ])
+            conn.executemany(self.INSERT_SHAREHOLDER_SQL, [
+                (cid, sh.name, sh.share_percent, sh.is_natural_person, sh.source)
+                for cid, _, _, _, shareholders in results
+                for sh in shareholders
+            ])
+
+    def update_flag(self, sql: str, params: Sequence = ()) -> int:
+        """Führt ein einzelnes UPDATE in einer eigenen Schreibtransaktion aus.
+
+        Args:
+            sql: UPDATE-Anweisung.
+            params: Parameter für die Anweisung.
+
+        Returns:
+            Anzahl geänderter Zeilen.
+        """
+        with self._write_transaction() as conn:
+            return conn.execute(sql, params).rowcount
 
     def log_event(self, company_id: int, stage: str, status: str,
                   message: str = "") -> None:
-        """Loggt Pipeline-Event."""
-        self.conn.execute("""
-            INSERT INTO pipeline_log (company_id, stage, status, message)
-            VALUES (?, ?, ?, ?)
-        """, (company_id, stage, status, message))
-        self.conn.commit()
+        """Puffert ein Pipeline-Event.
 
-    def get_stats(self) -> dict:
-        """Holt Pipeline-Statistiken."""
-        stats: dict = {}
+        Events werden gesammelt und ab LOG_FLUSH_THRESHOLD Einträgen, bei
+        flush_log() oder close() in einer Transaktion geschrieben.
+        """
+        self._log_buf.append((company_id, stage, status, message))
+        if len(self._log_buf) >= self.LOG_FLUSH_THRESHOLD:
+            self.flush_log()
 
-        stats['total'] = self.conn.execute(
-            "SELECT COUNT(*) FROM companies"
-        ).fetchone()[0]
+    def flush_log(self) -> None:
+        """Schreibt alle gepufferten Pipeline-Events in die Datenbank."""
+        if not self._log_buf:
+            return
 
-        stats['downloaded'] = self.conn.execute(
-            "SELECT COUNT(*) FROM companies WHERE dk_downloaded = TRUE"
-        ).fetchone()[0]
+        with self._write_transaction() as conn:
+            conn.executemany(self.INSERT_LOG_SQL, self._log_buf)
+        self._log_buf.clear()
 
-        stats['parsed'] = self.conn.execute(
-            "SELECT COUNT(*) FROM companies WHERE pdf_parsed = TRUE"
-        ).fetchone()[0]
+    def scalar(self, sql: str, params: Sequence = ()) -> object:
+        """Führt eine Abfrage aus und gibt den ersten Wert der ersten Zeile zurück.
 
-        stats['qualified'] = self.conn.execute(
-            "SELECT COUNT(*) FROM companies WHERE is_qualified = TRUE"
-        ).fetchone()[0]
+        Args:
+            sql: SQL-Abfrage, die (mindestens) eine Zeile liefert.
+            params: Parameter für die Abfrage.
 
-        stats['no_gl'] = self.conn.execute(
-            "SELECT COUNT(*) FROM companies WHERE dk_downloaded = TRUE AND pdf_path IS NULL"
-        ).fetchone()[0]
+        Returns:
+            Erster Spaltenwert der ersten Ergebniszeile.
+        """
+        return self.ro_conn.execute(sql, params).fetchone()[0]
 
-        return stats
+    def get_stats(self) -> dict:
+        """Holt Pipeline-Statistiken."""
+        return dict(self.ro_conn.execute(self.STATS_SQL).fetchone())
 
     def export_qualified(self, output_path: str) -> int:
         """Exportiert qualifizierte Leads als CSV.
@@ -270,7 +477,7 @@ class Database:
             PermissionError: Wenn keine Schreibberechtigung besteht.
             OSError: Bei sonstigen Dateisystemfehlern.
         """
-        rows = self.conn.execute("""
+        cursor = self.ro_conn.execute("""
             SELECT
                 c.id, c.name, c.city, c.court, c.register_type, c.register_num,
                 c.natural_persons_count, c.parsing_confidence,
@@ -280,7 +487,16 @@ class Database:
             WHERE c.is_qualified = TRUE
             GROUP BY c.id
             ORDER BY c.name
-        """).fetchall()
+        """)
+
+        exported = 0
+
+        def stream_rows() -> Iterator[sqlite3.Row]:
+            # Batchweise lesen statt fetchall(): Speicherbedarf O(Batch) statt O(N)
+            nonlocal exported
+            while batch := cursor.fetchmany(self.EXPORT_BATCH_SIZE):
+                exported += len(batch)
+                yield from batch
 
         try:
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
@@ -290,37 +506,15 @@ class Database:
                     'Registernummer', 'Anzahl Gesellschafter', 'Konfidenz', 'Gesellschafter'
                 ])
 
-                for row in rows:
-                    writer.writerow(list(row))
+                writer.writerows(stream_rows())
         except (FileNotFoundError, PermissionError, OSError) as e:
             logger.error(f"Export fehlgeschlagen: {e}")
             raise
 
-        return len(rows)
-
-    def rollback(self) -> None:
-        """Rolls back uncommitted changes."""
-        self.conn.rollback()
-
-    def _row_to_company(self, row: sqlite3.Row) -> Company:
-        """Konvertiert DB-Row zu Company-Objekt."""
-        return Company(
-            id=row['id'],
-            dealfront_id=row['dealfront_id'] or "",
-            name=row['name'],
-            city=row['city'] or "",
-            court=row['court'] or "",
-            register_type=row['register_type'] or "",
-            register_num=row['register_num'] or "",
-            dk_downloaded=bool(row['dk_downloaded']),
-            pdf_parsed=bool(row['pdf_parsed']),
-            pdf_path=row['pdf_path'],
-            natural_persons_count=row['natural_persons_count'],
-            legal_entities_count=row['legal_entities_count'],
-            parsing_confidence=row['parsing_confidence'],
-            is_qualified=bool(row['is_qualified']) if row['is_qualified'] is not None else None
-        )
+        return exported
 
     def close(self) -> None:
-        """Schließt Datenbankverbindung."""
+        """Schreibt gepufferte Events und schließt Lese- und Schreibverbindung."""
+        self.flush_log()
+        self.ro_conn.close()
         self.conn.close()
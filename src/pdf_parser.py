@@ -41,7 +41,7 @@ from models import Shareholder
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsingResult:
     """Ergebnis des PDF-Parsings."""
     shareholders: List[Shareholder]
@@ -13,8 +13,12 @@ import logging
 import sys
 import csv
 import re
+import multiprocessing
+import warnings
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 try:
@@ -29,7 +33,7 @@ from tqdm import tqdm
 
 from models import Database, Company, Shareholder
 from dk_downloader import GesellschafterlistenDownloader, DownloadResult
-from pdf_parser import GesellschafterlisteParser
+from pdf_parser import GesellschafterlisteParser, ParsingResult
 
 # Logging konfigurieren
 logging.basicConfig(
@@ -42,6 +46,187 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Anzahl geparster Firmen, die gemeinsam in einer Transaktion gespeichert werden
+PARSE_FLUSH_SIZE = 50
+
+# PDFs pro Auftrag an einen Parsing-Worker (run_parsing mit workers > 1)
+PARSE_CHUNKSIZE = 4
+
+# Registernummer-Muster (einmalig kompiliert, Eingabe ist bereits uppercase).
+# Ohne re.ASCII, damit \s auch geschuetzte Leerzeichen (\xa0) aus Excel-
+# Exporten erfasst; Umlaute im Gerichtsnamen stehen explizit in der Klasse.
+_RE_REG_FULL = re.compile(
+    r"(?:AMTSGERICHT\s+)?([A-Z0-9_ÄÖÜ]+)[\s,]+?(HRB|HRA|GNR|VR|PR)\s*(\d+)\s*([A-Z])?"
+)
+_RE_REG_TYPE = re.compile(r"(HRB|HRA|GNR|VR|PR)\s*(\d+)\s*([A-Z])?")
+_RE_REG_NUMBER = re.compile(r"^(\d+)\s*([A-Z])?$")
+
+# Registergerichte der groessten deutschen Staedte
+# (Schluessel kleingeschrieben, Umlaute transliteriert)
+_CITY_COURT = {
+    "berlin": "Berlin (Charlottenburg)",
+    "muenchen": "München",
+    "munich": "München",
+    "hamburg": "Hamburg",
+    "frankfurt": "Frankfurt am Main",
+    "koeln": "Köln",
+    "cologne": "Köln",
+    "duesseldorf": "Düsseldorf",
+    "stuttgart": "Stuttgart",
+    "dortmund": "Dortmund",
+    "essen": "Essen",
+    "bremen": "Bremen",
+    "leipzig": "Leipzig",
+    "dresden": "Dresden",
+    "hannover": "Hannover",
+    "nuernberg": "Nürnberg",
+    "nuremberg": "Nürnberg",
+}
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+# Woerter eines (transliterierten) Stadtnamens, getrennt an Leerzeichen,
+# Ziffern, Bindestrichen usw.
+_RE_CITY_WORD = re.compile(r"[a-z]+")
+
+# Moegliche Spaltennamen (lowercase) je Importfeld im CSV-Import
+_CSV_FIELDS = {
+    "name": ['firma', 'firmenname', 'name', 'company', 'company name'],
+    "city": ['ort', 'stadt', 'city', 'location'],
+    "court": ['district court', 'registergericht', 'gericht', 'court'],
+    "register": ['registernummer', 'register number', 'hrb', 'hra'],
+    "id": ['id', 'dealfront_id', 'company_id'],
+}
+
+
+@lru_cache(maxsize=4096)
+def _lookup_court(city: str) -> str:
+    """Ermittelt das Registergericht zu einem (nicht-leeren) Stadtnamen."""
+    key = city.strip().lower().translate(_UMLAUTS)
+
+    # Schneller Pfad: exakter Treffer
+    court = _CITY_COURT.get(key)
+    if court is not None:
+        return court
+
+    # Wort-Treffer, z.B. "Frankfurt am Main" oder "80331 München". Ganze
+    # Woerter statt Teilstrings, sonst wuerde "giessen" auf "essen" passen.
+    for word in _RE_CITY_WORD.findall(key):
+        court = _CITY_COURT.get(word)
+        if court is not None:
+            return court
+
+    return city  # Fallback: Stadt als Gericht verwenden
+
+
+@lru_cache(maxsize=16384)
+def _parse_register(register_raw: str, city: str) -> tuple[str, str, str]:
+    """Gecachte Implementierung von GFScreeningPipeline._parse_register_field."""
+    if not register_raw:
+        return "", "", ""
+
+    register_raw = register_raw.strip().upper()
+
+    # Pattern 1: Vollstaendig mit Gericht
+    match = _RE_REG_FULL.search(register_raw)
+    if match:
+        court = match.group(1)
+        reg_type = match.group(2)
+        reg_num = match.group(3)
+        suffix = match.group(4) or ""
+        return reg_type, f"{reg_num} {suffix}".strip(), court
+
+    # Pattern 2: Typ + Nummer
+    match = _RE_REG_TYPE.search(register_raw)
+    if match:
+        reg_type = match.group(1)
+        reg_num = match.group(2)
+        suffix = match.group(3) or ""
+        # Gericht aus Stadt ableiten
+        court = _lookup_court(city) if city else ""
+        return reg_type, f"{reg_num} {suffix}".strip(), court
+
+    # Pattern 3: Nur Nummer (HRB annehmen)
+    match = _RE_REG_NUMBER.search(register_raw)
+    if match:
+        reg_num = match.group(1)
+        suffix = match.group(2) or ""
+        court = _lookup_court(city) if city else ""
+        return "HRB", f"{reg_num} {suffix}".strip(), court
+
+    return "", "", ""
+
+
+# Bytes am Dateianfang, die fuer die Delimiter-Erkennung gelesen werden
+_DELIMITER_SAMPLE_SIZE = 64 * 1024
+
+
+def _detect_delimiter(csv_path: Path, delimiter: str) -> str:
+    """
+    Erkennt den CSV-Delimiter anhand der Kopfzeile.
+
+    Gezaehlt werden der gewuenschte Delimiter sowie ',', ';' und Tab in
+    der ersten Zeile, damit einzelne Trennzeichen in Datenwerten
+    (z.B. "Foo; Bar GmbH") nicht den Ausschlag geben. Der gewuenschte Delimiter gewinnt, wenn er am haeufigsten
+    vorkommt oder gleichauf liegt; sonst das haeufigste Zeichen. Nur bei
+    Gleichstand ohne den gewuenschten Delimiter wird csv.Sniffer befragt.
+    """
+    with open(csv_path, 'rb') as f:
+        head = f.read(_DELIMITER_SAMPLE_SIZE)
+    header = head.split(b'\n', 1)[0]
+
+    # Auch ein nicht-standardmaessiger Delimiter (z.B. '|') wird mitgezaehlt
+    candidates = dict.fromkeys((delimiter, ',', ';', '\t'))
+    counts = {d: header.count(d.encode()) for d in candidates}
+    top = max(counts.values())
+    if not top or counts[delimiter] == top:
+        return delimiter  # Einspaltige Datei: Delimiter spielt keine Rolle
+
+    leaders = [d for d, n in counts.items() if n == top]
+    if len(leaders) == 1:
+        return leaders[0]
+
+    try:
+        sample = head.decode('utf-8-sig', 'ignore')
+        return csv.Sniffer().sniff(sample, delimiters=''.join(leaders)).delimiter
+    except csv.Error:
+        return leaders[0]
+
+
+# (company_id, Ergebnis, Fehlerart, Fehlername) - Fehlerart ist None bei Erfolg
+ParseOutcome = tuple[int, Optional[ParsingResult], Optional[str], str]
+
+
+def _parse_pdf(parser: GesellschafterlisteParser, company_id: int, pdf_path: Path) -> ParseOutcome:
+    """
+    Parst ein PDF und faengt Fehler ab, damit sie im Elternprozess geloggt werden.
+
+    Unterscheidet PDF-spezifische Fehler (pdfplumber), Datei-Fehler und
+    allgemeine Fehler fuer besseres Debugging.
+    """
+    try:
+        return company_id, parser.parse(pdf_path), None, ""
+    except pdfplumber.pdfminer.pdfparser.PDFSyntaxError as e:
+        return company_id, None, "PDF-Syntax", type(e).__name__
+    except (FileNotFoundError, PermissionError, OSError) as e:
+        return company_id, None, "Datei", type(e).__name__
+    except Exception as e:
+        return company_id, None, "Parsing", type(e).__name__
+
+
+# Parser-Instanz je Worker-Prozess (gesetzt durch _init_parse_worker)
+_worker_parser: Optional[GesellschafterlisteParser] = None
+
+
+def _init_parse_worker() -> None:
+    """Initialisiert den Parser einmal pro Worker-Prozess."""
+    global _worker_parser
+    _worker_parser = GesellschafterlisteParser()
+
+
+def _parse_in_worker(item: tuple[int, Path]) -> ParseOutcome:
+    """Pool-Task: parst ein (company_id, pdf_path)-Paar im Worker-Prozess."""
+    company_id, pdf_path = item
+    return _parse_pdf(_worker_parser, company_id, pdf_path)
+
 
 class GFScreeningPipeline:
     """
@@ -52,21 +237,30 @@ class GFScreeningPipeline:
     Workflow von der Firmenerfassung bis zum qualifizierten Lead-Export.
     """
 
-    def __init__(self, base_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self, base_dir: Optional[Path] = None, db_path: Optional[str | Path] = None
+    ) -> None:
         """
         Initialisiert die Pipeline.
 
         Args:
             base_dir: Basisverzeichnis (default: Elternverzeichnis von src/)
+            db_path: Pfad zur Datenbank oder ":memory:"
+                (default: base_dir/data/gesellschafter.db)
         """
         if base_dir is None:
             base_dir = Path(__file__).parent.parent
 
         self.base_dir = Path(base_dir)
-        self.db = Database(str(self.base_dir / "data" / "gesellschafter.db"))
+        if db_path is None:
+            db_path = self.base_dir / "data" / "gesellschafter.db"
+        self.db = Database(str(db_path))
         self.pdf_dir = self.base_dir / "pdfs"
         self.output_dir = self.base_dir / "output"
 
+        # Im WAL-Modus genuegt fsync beim Checkpoint statt bei jedem Commit
+        self.db.conn.execute("PRAGMA synchronous=NORMAL")
+
         # Verzeichnisse erstellen
         self.pdf_dir.mkdir(parents=True, exist_ok=True)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -131,7 +325,7 @@ class GFScreeningPipeline:
 
         logger.info(f"Excel geladen: {len(df)} Zeilen, {len(df.columns)} Spalten")
 
-        imported = 0
+        companies: list[Company] = []
         skipped = 0
 
         for _, row in df.iterrows():
@@ -166,17 +360,17 @@ class GFScreeningPipeline:
             # Rechtsform (optional fuer Filter)
             legal_form = str(row.get('Legal Form', '')).strip()
 
-            company = Company(
+            companies.append(Company(
                 dealfront_id=dealfront_id,
                 name=name,
                 city=city,
                 court=court,
                 register_type=reg_type,
                 register_num=f"{reg_type} {reg_num}".strip() if reg_type and reg_num else ""
-            )
+            ))
 
-            self.db.insert_company(company)
-            imported += 1
+        # Alle Firmen in einer Transaktion einfuegen
+        imported = self.db.insert_companies(companies)
 
         logger.info(f"Import abgeschlossen: {imported} importiert, {skipped} uebersprungen")
 
@@ -184,9 +378,9 @@ class GFScreeningPipeline:
         stats = self.db.get_stats()
         logger.info(f"Datenbank-Status: {stats['total']} Firmen gesamt")
 
-        missing_register = self.db.conn.execute(
+        missing_register = self.db.scalar(
             "SELECT COUNT(*) FROM companies WHERE register_num IS NULL OR register_num = ''"
-        ).fetchone()[0]
+        )
 
         if missing_register > 0:
             logger.warning(f"{missing_register} Firmen ohne Registernummer!")
@@ -202,63 +396,11 @@ class GFScreeningPipeline:
             csv_path: Pfad zur CSV-Datei.
             delimiter: CSV-Delimiter (default: ';').
         """
-        imported = 0
+        companies: list[Company] = []
         skipped = 0
 
         try:
-            with open(csv_path, encoding='utf-8-sig') as f:
-                # Delimiter erkennen
-                sample = f.read(1024)
-                f.seek(0)
-
-                if delimiter not in sample:
-                    delimiter = ',' if ',' in sample else '\t'
-
-                reader = csv.DictReader(f, delimiter=delimiter)
-                fieldnames = {fn.lower().strip(): fn for fn in reader.fieldnames}
-
-                for row in reader:
-                    name = self._get_field(row, fieldnames, [
-                        'firma', 'firmenname', 'name', 'company', 'company name'
-                    ])
-
-                    if not name:
-                        skipped += 1
-                        continue
-
-                    city = self._get_field(row, fieldnames, [
-                        'ort', 'stadt', 'city', 'location'
-                    ]) or ""
-
-                    court = self._get_field(row, fieldnames, [
-                        'district court', 'registergericht', 'gericht', 'court'
-                    ]) or ""
-
-                    register_raw = self._get_field(row, fieldnames, [
-                        'registernummer', 'register number', 'hrb', 'hra'
-                    ]) or ""
-
-                    reg_type, reg_num, parsed_court = self._parse_register_field(register_raw, city)
-
-                    if not court:
-                        court = parsed_court
-
-                    dealfront_id = self._get_field(row, fieldnames, [
-                        'id', 'dealfront_id', 'company_id'
-                    ]) or name
-
-                    company = Company(
-                        dealfront_id=dealfront_id,
-                        name=name.strip(),
-                        city=city.strip(),
-                        court=court,
-                        register_type=reg_type,
-                        register_num=f"{reg_type} {reg_num}".strip() if reg_type and reg_num else ""
-                    )
-
-                    self.db.insert_company(company)
-                    imported += 1
-
+            columns = self._read_csv_columns(csv_path, delimiter)
         except FileNotFoundError:
             logger.error(f"CSV-Datei nicht gefunden: {csv_path}")
             return
@@ -269,8 +411,91 @@ class GFScreeningPipeline:
             logger.error(f"Keine Leseberechtigung: {csv_path}")
             return
 
+        for name, city, court, register_raw, dealfront_id in zip(
+            columns["name"], columns["city"], columns["court"],
+            columns["register"], columns["id"]
+        ):
+            if not name:
+                skipped += 1
+                continue
+
+            reg_type, reg_num, parsed_court = self._parse_register_field(register_raw, city)
+
+            if not court:
+                court = parsed_court
+
+            companies.append(Company(
+                dealfront_id=dealfront_id or name,
+                name=name,
+                city=city,
+                court=court,
+                register_type=reg_type,
+                register_num=f"{reg_type} {reg_num}".strip() if reg_type and reg_num else ""
+            ))
+
+        # Alle Firmen in einer Transaktion einfuegen
+        imported = self.db.insert_companies(companies)
+
         logger.info(f"Import abgeschlossen: {imported} importiert, {skipped} uebersprungen")
 
+    def _read_csv_columns(self, csv_path: Path, delimiter: str) -> dict[str, list[str]]:
+        """
+        Liest die Importfelder einer CSV-Datei spaltenweise ein.
+
+        Mit pandas wird die Datei vom C-Parser gelesen und die Kandidaten-
+        Spalten je Feld vektorisiert zusammengefuehrt (erster nicht-leerer
+        Wert gewinnt). Ohne pandas oder bei fehlerhaften Dateien wird
+        zeilenweise mit csv.DictReader gelesen.
+
+        Args:
+            csv_path: Pfad zur CSV-Datei.
+            delimiter: Gewuenschter CSV-Delimiter.
+
+        Returns:
+            Mapping Feldname -> Werte je Zeile (gestrippt, "" falls leer).
+        """
+        delimiter = _detect_delimiter(csv_path, delimiter)
+
+        if HAS_PANDAS:
+            try:
+                # Zeilen mit abschliessendem Delimiter haben ein Feld mehr als der
+                # Header; ohne index_col=False wuerde pandas die erste Spalte zum
+                # Index machen und alle Spalten verschieben. Das ueberzaehlige
+                # (leere) Feld wird wie bei csv.DictReader verworfen.
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", pd.errors.ParserWarning)
+                    df = pd.read_csv(
+                        csv_path, sep=delimiter, dtype=str, encoding='utf-8-sig',
+                        engine='c', keep_default_na=False, index_col=False
+                    ).fillna("")
+            except (pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+                logger.warning(f"pandas konnte CSV nicht lesen ({type(e).__name__}), nutze csv-Modul")
+            else:
+                fieldnames = {str(fn).lower().strip(): fn for fn in df.columns}
+                columns: dict[str, list[str]] = {}
+                for field, candidates in _CSV_FIELDS.items():
+                    merged = None
+                    for candidate in candidates:
+                        if candidate in fieldnames:
+                            values = df[fieldnames[candidate]]
+                            merged = values if merged is None else merged.where(merged != "", values)
+                    columns[field] = [""] * len(df) if merged is None else merged.str.strip().tolist()
+                return columns
+
+        with open(csv_path, encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f, delimiter=delimiter)
+            fieldnames = {fn.lower().strip(): fn for fn in reader.fieldnames or []}
+            # Nur Kandidaten behalten, die im Header vorkommen (einmal pro Datei)
+            present = {
+                field: [c for c in candidates if c in fieldnames]
+                for field, candidates in _CSV_FIELDS.items()
+            }
+            columns = {field: [] for field in _CSV_FIELDS}
+            for row in reader:
+                for field, candidates in present.items():
+                    columns[field].append(self._get_field(row, fieldnames, candidates) or "")
+        return columns
+
     def import_csv(self, csv_path: str, delimiter: str = ';') -> None:
         """
         Alias fuer import_file (Abwaertskompatibilitaet).
@@ -291,7 +516,9 @@ class GFScreeningPipeline:
         Findet Feldwert basierend auf verschiedenen Spaltennamen.
 
         Durchsucht die Kandidaten-Liste case-insensitive und gibt den
-        ersten gefundenen nicht-leeren Wert zurueck.
+        ersten gefundenen nicht-leeren Wert zurueck. Pro Kandidat genuegt
+        ein Dict-Zugriff, da fieldnames bereits beim Lesen des Headers
+        auf lowercase normalisiert wird.
 
         Args:
             row: Zeile als Dictionary (aus csv.DictReader).
@@ -305,9 +532,9 @@ class GFScreeningPipeline:
             return None
 
         for candidate in candidates:
-            if candidate in fieldnames:
-                original_name = fieldnames[candidate]
-                value = row.get(original_name, "")
+            original_name = fieldnames.get(candidate)
+            if original_name is not None:
+                value = row.get(original_name)
                 if value:
                     return value.strip()
         return None
@@ -323,6 +550,9 @@ class GFScreeningPipeline:
         - "Amtsgericht Berlin HRB 12345"
         - "Berlin, HRB 12345"
 
+        Ergebnisse werden pro (register_raw, city) gecacht, da sich Werte
+        innerhalb eines Imports haeufig wiederholen.
+
         Args:
             register_raw: Rohe Registernummer-Zeichenkette.
             city: Stadt fuer Gericht-Fallback.
@@ -330,49 +560,15 @@ class GFScreeningPipeline:
         Returns:
             Tuple aus (register_type, register_number, court).
         """
-        if not register_raw:
-            return "", "", ""
-
-        register_raw = register_raw.strip().upper()
-
-        # Pattern 1: Vollstaendig mit Gericht
-        match = re.search(
-            r"(?:AMTSGERICHT\s+)?(\w+)[\s,]+?(HRB|HRA|GNR|VR|PR)\s*(\d+)\s*([A-Z])?",
-            register_raw
-        )
-        if match:
-            court = match.group(1)
-            reg_type = match.group(2)
-            reg_num = match.group(3)
-            suffix = match.group(4) or ""
-            return reg_type, f"{reg_num} {suffix}".strip(), court
-
-        # Pattern 2: Typ + Nummer
-        match = re.search(r"(HRB|HRA|GNR|VR|PR)\s*(\d+)\s*([A-Z])?", register_raw)
-        if match:
-            reg_type = match.group(1)
-            reg_num = match.group(2)
-            suffix = match.group(3) or ""
-            # Gericht aus Stadt ableiten
-            court = self._city_to_court(city)
-            return reg_type, f"{reg_num} {suffix}".strip(), court
-
-        # Pattern 3: Nur Nummer (HRB annehmen)
-        match = re.search(r"^(\d+)\s*([A-Z])?$", register_raw)
-        if match:
-            reg_num = match.group(1)
-            suffix = match.group(2) or ""
-            court = self._city_to_court(city)
-            return "HRB", f"{reg_num} {suffix}".strip(), court
-
-        return "", "", ""
+        return _parse_register(register_raw or "", city or "")
 
     def _city_to_court(self, city: str) -> str:
         """
         Leitet Registergericht aus Stadt ab (vereinfacht).
 
         Verwendet ein statisches Mapping der groessten deutschen Staedte
-        zu ihren Registergerichten.
+        zu ihren Registergerichten. Ergebnisse werden pro Stadtname
+        gecacht, da beim Import dieselben Staedte sehr oft vorkommen.
 
         Args:
             city: Stadtname.
@@ -383,34 +579,7 @@ class GFScreeningPipeline:
         if not city:
             return ""
 
-        city_lower = city.lower()
-
-        # Direkte Mappings
-        court_map = {
-            "berlin": "Berlin (Charlottenburg)",
-            "münchen": "München",
-            "munich": "München",
-            "hamburg": "Hamburg",
-            "frankfurt": "Frankfurt am Main",
-            "köln": "Köln",
-            "cologne": "Köln",
-            "düsseldorf": "Düsseldorf",
-            "stuttgart": "Stuttgart",
-            "dortmund": "Dortmund",
-            "essen": "Essen",
-            "bremen": "Bremen",
-            "leipzig": "Leipzig",
-            "dresden": "Dresden",
-            "hannover": "Hannover",
-            "nürnberg": "Nürnberg",
-            "nuremberg": "Nürnberg",
-        }
-
-        for key, value in court_map.items():
-            if key in city_lower:
-                return value
-
-        return city  # Fallback: Stadt als Gericht verwenden
+        return _lookup_court(city)
 
     def run_downloads(self, limit: Optional[int] = None, resume: bool = True) -> None:
         """
@@ -419,6 +588,11 @@ class GFScreeningPipeline:
         Holt ausstehende Firmen aus der Datenbank und startet den
         Selenium-basierten Download von handelsregister.de.
 
+        Downloads laufen bewusst sequentiell: der Downloader steuert einen
+        einzelnen WebDriver und der RateLimiter begrenzt die Abrufe bei
+        handelsregister.de ohnehin auf rate_limit_per_hour. Parallele
+        Worker wuerden das Limit verletzen, ohne den Durchsatz zu erhoehen.
+
         Args:
             limit: Maximale Anzahl Downloads (None = alle).
             resume: Bei vorherigen Downloads fortfahren.
@@ -445,46 +619,60 @@ class GFScreeningPipeline:
                         company.register_num,
                         company.court
                     )
-
-                    if result.success:
-                        self.db.update_download_status(
-                            company.id,
-                            str(result.pdf_path) if result.pdf_path else None,
-                            True
-                        )
-
-                        if result.no_gl_available:
-                            self.db.log_event(
-                                company.id, "download", "no_gl",
-                                "Keine Gesellschafterliste verfuegbar"
-                            )
-                        else:
-                            self.db.log_event(company.id, "download", "success")
-                    else:
-                        self.db.log_event(
-                            company.id, "download", "error",
-                            result.error or "Unbekannter Fehler"
-                        )
-                        # Trotzdem als "versucht" markieren
-                        self.db.update_download_status(company.id, None, False)
+                    self._apply_download_result(company, result)
 
         finally:
             downloader.stop()
+            self.db.flush_log()
 
         # Statistiken
         stats = self.db.get_stats()
         logger.info(f"Download-Status: {stats['downloaded']}/{stats['total']} abgeschlossen")
         logger.info(f"Ohne Gesellschafterliste: {stats['no_gl']}")
 
-    def run_parsing(self, limit: Optional[int] = None) -> None:
+    def _apply_download_result(self, company: Company, result: DownloadResult) -> None:
+        """
+        Speichert Download-Status und Log-Event einer Firma in der Datenbank.
+
+        Args:
+            company: Firma, fuer die heruntergeladen wurde.
+            result: Ergebnis von GesellschafterlistenDownloader.download().
+        """
+        if result.success:
+            self.db.update_download_status(
+                company.id,
+                str(result.pdf_path) if result.pdf_path else None,
+                True
+            )
+
+            if result.no_gl_available:
+                self.db.log_event(
+                    company.id, "download", "no_gl",
+                    "Keine Gesellschafterliste verfuegbar"
+                )
+            else:
+                self.db.log_event(company.id, "download", "success")
+        else:
+            self.db.log_event(
+                company.id, "download", "error",
+                result.error or "Unbekannter Fehler"
+            )
+            # Trotzdem als "versucht" markieren
+            self.db.update_download_status(company.id, None, False)
+
+    def run_parsing(self, limit: Optional[int] = None, workers: int = 1) -> None:
         """
         Parst heruntergeladene PDFs und extrahiert Gesellschafterstrukturen.
 
-        Unterscheidet zwischen PDF-spezifischen Fehlern (pdfplumber),
-        Datei-Fehlern und allgemeinen Fehlern fuer besseres Debugging.
+        Das Parsen ist CPU-gebunden; mit workers > 1 werden die PDFs ueber
+        einen multiprocessing.Pool verteilt. Die Datenbank wird nur im
+        Elternprozess geschrieben. Ergebnisse werden in Bloecken von
+        PARSE_FLUSH_SIZE Firmen in einer Transaktion gespeichert; der
+        letzte Block auch dann, wenn das Parsen abgebrochen wird.
 
         Args:
             limit: Maximale Anzahl zu parsender PDFs.
+            workers: Anzahl Parsing-Prozesse (1 = im aktuellen Prozess).
         """
         companies = self.db.get_pending_parsing(limit)
 
@@ -494,69 +682,75 @@ class GFScreeningPipeline:
 
         logger.info(f"Parse {len(companies)} PDFs...")
 
-        parser = GesellschafterlisteParser()
-
         qualified_count = 0
         error_count = 0
-
-        with tqdm(companies, desc="Parsing", unit="PDF") as pbar:
-            for company in pbar:
-                pbar.set_postfix_str(f"{company.name[:30]}...")
-
-                pdf_path = Path(company.pdf_path)
-
-                if not pdf_path.exists():
-                    logger.warning(f"PDF nicht gefunden fuer Firma ID {company.id}")
+        pending_results: list = []
+
+        items: list[tuple[int, Path]] = []
+        for company in companies:
+            pdf_path = Path(company.pdf_path)
+            if not pdf_path.exists():
+                logger.warning(f"PDF nicht gefunden fuer Firma ID {company.id}")
+                error_count += 1
+                continue
+            items.append((company.id, pdf_path))
+
+        def flush_results() -> None:
+            self.db.bulk_update_parsing_results(pending_results)
+            # Erfolg erst loggen, wenn das Ergebnis gespeichert ist
+            for update in pending_results:
+                self.db.log_event(update[0], "parse", "success")
+            pending_results.clear()
+
+        with ExitStack() as stack:
+            # Laeuft auch bei Abbruch (Exception, Strg+C), nachdem der Pool
+            # beendet ist: bereits geparste Ergebnisse gehen nicht verloren
+            stack.callback(self.db.flush_log)
+            stack.callback(flush_results)
+
+            if workers > 1:
+                pool = stack.enter_context(
+                    multiprocessing.Pool(workers, initializer=_init_parse_worker)
+                )
+                outcomes = pool.imap_unordered(_parse_in_worker, items, chunksize=PARSE_CHUNKSIZE)
+            else:
+                parser = GesellschafterlisteParser()
+                outcomes = (_parse_pdf(parser, company_id, pdf_path) for company_id, pdf_path in items)
+
+            for company_id, result, error_kind, error_name in tqdm(
+                outcomes, total=len(items), desc="Parsing", unit="PDF"
+            ):
+                if len(pending_results) >= PARSE_FLUSH_SIZE:
+                    flush_results()
+
+                if error_kind is not None:
+                    logger.error(f"{error_kind}-Fehler fuer Firma ID {company_id}: {error_name}")
+                    detail = error_name if error_kind == "Parsing" else f"{error_kind}: {error_name}"
+                    self.db.log_event(company_id, "parse", "error", detail)
                     error_count += 1
                     continue
 
-                try:
-                    result = parser.parse(pdf_path)
-
-                    shareholders = [
-                        Shareholder(
-                            company_id=company.id,
-                            name=sh.name,
-                            share_percent=sh.share_percent,
-                            is_natural_person=sh.is_natural_person,
-                            source=sh.source
-                        )
-                        for sh in result.shareholders
-                    ]
-
-                    self.db.update_parsing_result(
-                        company.id,
-                        result.natural_persons_count,
-                        result.legal_entities_count,
-                        result.confidence,
-                        shareholders
+                shareholders = [
+                    Shareholder(
+                        company_id=company_id,
+                        name=sh.name,
+                        share_percent=sh.share_percent,
+                        is_natural_person=sh.is_natural_person,
+                        source=sh.source
                     )
+                    for sh in result.shareholders
+                ]
 
-                    if result.natural_persons_count <= 2 and result.legal_entities_count == 0:
-                        qualified_count += 1
-
-                    self.db.log_event(company.id, "parse", "success")
+                pending_results.append((
+                    company_id,
+                    result.natural_persons_count,
+                    result.legal_entities_count,
+                    result.confidence,
+                    shareholders
+                ))
 
-                except pdfplumber.pdfminer.pdfparser.PDFSyntaxError as e:
-                    logger.error(
-                        f"PDF-Syntax-Fehler fuer Firma ID {company.id}: {type(e).__name__}"
-                    )
-                    self.db.log_event(company.id, "parse", "error", f"PDF-Syntax: {type(e).__name__}")
-                    error_count += 1
-
-                except (FileNotFoundError, PermissionError, OSError) as e:
-                    logger.error(
-                        f"Datei-Fehler fuer Firma ID {company.id}: {type(e).__name__}"
-                    )
-                    self.db.log_event(company.id, "parse", "error", f"Datei: {type(e).__name__}")
-                    error_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Parsing-Fehler fuer Firma ID {company.id}: {type(e).__name__}"
-                    )
-                    self.db.log_event(company.id, "parse", "error", type(e).__name__)
-                    error_count += 1
+                if result.natural_persons_count <= 2 and result.legal_entities_count == 0:
+                    qualified_count += 1
 
         logger.info(f"Parsing abgeschlossen: {qualified_count} qualifiziert, {error_count} Fehler")
 
@@ -625,6 +819,9 @@ def main() -> None:
     # Parse
     parse_parser = subparsers.add_parser("parse", help="PDFs parsen")
     parse_parser.add_argument("--limit", type=int, help="Max. Anzahl zu parsender PDFs")
+    parse_parser.add_argument(
+        "--workers", type=int, default=1, help="Anzahl Parsing-Prozesse (default: 1)"
+    )
 
     # Export
     export_parser = subparsers.add_parser("export", help="Qualifizierte Leads exportieren")
@@ -656,7 +853,7 @@ def main() -> None:
             pipeline.run_downloads(limit=args.limit)
 
         elif args.command == "parse":
-            pipeline.run_parsing(limit=args.limit)
+            pipeline.run_parsing(limit=args.limit, workers=args.workers)
 
         elif args.command == "export":
             pipeline.export(args.output)
@@ -673,8 +870,9 @@ def main() -> None:
             pipeline.show_stats()
 
     except Exception as e:
+        # Kein Rollback noetig: jede Schreibtransaktion wird in
+        # Database._write_transaction abgeschlossen oder zurueckgerollt
         logger.error(f"Pipeline-Fehler: {e}")
-        pipeline.db.conn.rollback()
         raise
 
     finally:
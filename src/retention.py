@@ -13,17 +13,34 @@ Usage:
 from __future__ import annotations
 
 import logging
+import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Final, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_RETENTION_DAYS = 90
+DEFAULT_RETENTION_DAYS: Final[int] = 90
 """Default retention period in days. After this period, PDFs and
 database entries are eligible for deletion."""
 
+_MEDIA_SUFFIXES = (".pdf", ".tif", ".tiff")
+
+
+def _scan(directory: Path, suffixes: Tuple[str, ...], prefix: str = "") -> Iterator[os.DirEntry]:
+    """Yields the regular files in directory whose name matches prefix/suffixes.
+
+    os.scandir() returns the file type with each directory entry, so the
+    name filter and the is_file() check need no stat() call; only matching
+    files are stat()ed afterwards by the caller.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(suffixes) and entry.is_file():
+                yield entry
+
 
 def cleanup_old_pdfs(pdf_dir: Path, max_age_days: int = DEFAULT_RETENTION_DAYS) -> int:
     """Deletes PDF and TIF files older than max_age_days.
@@ -42,15 +59,14 @@ def cleanup_old_pdfs(pdf_dir: Path, max_age_days: int = DEFAULT_RETENTION_DAYS)
     cutoff = time.time() - (max_age_days * 86400)
     deleted = 0
 
-    for pattern in ("*.pdf", "*.tif", "*.tiff"):
-        for file_path in pdf_dir.glob(pattern):
-            try:
-                if file_path.stat().st_mtime < cutoff:
-                    file_path.unlink()
-                    deleted += 1
-                    logger.info(f"Geloescht (>{max_age_days}d alt): {file_path.name}")
-            except OSError as e:
-                logger.warning(f"Konnte Datei nicht loeschen {file_path.name}: {e}")
+    for entry in _scan(pdf_dir, _MEDIA_SUFFIXES):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                deleted += 1
+                logger.info(f"Geloescht (>{max_age_days}d alt): {entry.name}")
+        except OSError as e:
+            logger.warning(f"Konnte Datei nicht loeschen {entry.name}: {e}")
 
     return deleted
 
@@ -71,14 +87,14 @@ def cleanup_old_exports(output_dir: Path, max_age_days: int = DEFAULT_RETENTION_
     cutoff = time.time() - (max_age_days * 86400)
     deleted = 0
 
-    for csv_file in output_dir.glob("*.csv"):
+    for entry in _scan(output_dir, (".csv",)):
         try:
-            if csv_file.stat().st_mtime < cutoff:
-                csv_file.unlink()
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
                 deleted += 1
-                logger.info(f"Export geloescht (>{max_age_days}d alt): {csv_file.name}")
+                logger.info(f"Export geloescht (>{max_age_days}d alt): {entry.name}")
         except OSError as e:
-            logger.warning(f"Konnte Export nicht loeschen {csv_file.name}: {e}")
+            logger.warning(f"Konnte Export nicht loeschen {entry.name}: {e}")
 
     return deleted
 
@@ -102,10 +118,10 @@ def cleanup_debug_screenshots(debug_dir: Path, max_age_hours: int = 24) -> int:
     cutoff = time.time() - (max_age_hours * 3600)
     deleted = 0
 
-    for screenshot in debug_dir.glob("debug_*.png"):
+    for entry in _scan(debug_dir, (".png",), prefix="debug_"):
         try:
-            if screenshot.stat().st_mtime < cutoff:
-                screenshot.unlink()
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
                 deleted += 1
         except OSError:
             pass
@@ -143,18 +159,19 @@ def run_full_cleanup(
         cutoff_debug = time.time() - (24 * 3600)
 
         if pdf_dir.exists():
-            for p in ("*.pdf", "*.tif", "*.tiff"):
-                results["pdfs"] += sum(
-                    1 for f in pdf_dir.glob(p) if f.stat().st_mtime < cutoff_pdf
-                )
+            results["pdfs"] = sum(
+                1 for e in _scan(pdf_dir, _MEDIA_SUFFIXES)
+                if e.stat().st_mtime < cutoff_pdf
+            )
         if output_dir.exists():
             results["exports"] = sum(
-                1 for f in output_dir.glob("*.csv") if f.stat().st_mtime < cutoff_pdf
+                1 for e in _scan(output_dir, (".csv",))
+                if e.stat().st_mtime < cutoff_pdf
             )
         if debug_dir.exists():
             results["debug"] = sum(
-                1 for f in debug_dir.glob("debug_*.png")
-                if f.stat().st_mtime < cutoff_debug
+                1 for e in _scan(debug_dir, (".png",), prefix="debug_")
+                if e.stat().st_mtime < cutoff_debug
             )
 
         logger.info(f"[DRY RUN] Wuerde loeschen: {results}")
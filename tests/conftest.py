@@ -8,7 +8,10 @@ pipeline instances, parser instances, and test data generators.
 import csv
 import tempfile
 import os
+import time
 from pathlib import Path
+from typing import Optional
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -17,6 +20,22 @@ from pdf_parser import GesellschafterlisteParser
 from pipeline import GFScreeningPipeline
 
 
+def pytest_configure(config):
+    """Puts the temp root for the whole suite on tmpfs when PYTEST_RAMDISK is set.
+
+    Every tmp_path/tmp_path_factory directory then lives in RAM. /dev/shm
+    only replaces the root: pytest still creates its numbered, locked
+    pytest-of-<user>/pytest-N directories there, so concurrent sessions
+    don't clear each other's files. An explicit --basetemp or
+    PYTEST_DEBUG_TEMPROOT always wins; xdist workers inherit the variable.
+    """
+    if not os.environ.get("PYTEST_RAMDISK"):
+        return
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(shm))
+
+
 @pytest.fixture
 def temp_db():
     """Creates a temporary SQLite database for testing.
@@ -37,21 +56,132 @@ def temp_db():
         pass
 
 
+@pytest.fixture(scope="module")
+def schema_db():
+    """In-memory database shared by read-only schema introspection tests.
+
+    Must not be written to -- use temp_db for tests that mutate state.
+    """
+    db = Database(":memory:")
+    yield db
+    db.close()
+
+
 @pytest.fixture
 def temp_pipeline():
-    """Creates a pipeline with a temporary working directory."""
+    """Creates a pipeline with a temporary working directory and in-memory DB."""
     with tempfile.TemporaryDirectory() as tmpdir:
-        pipeline = GFScreeningPipeline(base_dir=Path(tmpdir))
+        pipeline = GFScreeningPipeline(base_dir=Path(tmpdir), db_path=":memory:")
         yield pipeline
         pipeline.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def ro_pipeline(tmp_path_factory):
+    """Pipeline shared by tests that only call pure helper methods.
+
+    Must not be used for imports, downloads, parsing or export -- use
+    temp_pipeline for tests that touch the database or filesystem.
+    """
+    pipeline = GFScreeningPipeline(
+        base_dir=tmp_path_factory.mktemp("ro_pipeline"), db_path=":memory:"
+    )
+    yield pipeline
+    pipeline.close()
+
+
+@pytest.fixture(scope="session")
 def parser():
-    """Creates a GesellschafterlisteParser instance."""
+    """Shared GesellschafterlisteParser instance.
+
+    The parser keeps no per-instance state (patterns are class-level),
+    so one instance is reused across the whole session.
+    """
     return GesellschafterlisteParser()
 
 
+class _StubPage:
+    """Minimal stand-in for a pdfplumber page."""
+
+    def __init__(self, text, tables=()):
+        self._text = text
+        self._tables = list(tables)
+
+    def extract_text(self):
+        return self._text
+
+    def extract_tables(self):
+        return self._tables
+
+
+class _StubPDF:
+    """Minimal stand-in for the object returned by pdfplumber.open()."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+@pytest.fixture(scope="session")
+def mock_pdfplumber_two_shareholders():
+    """Stub pdfplumber PDF: one page listing a natural person and a GmbH.
+
+    Pass it as return_value when patching pdf_parser.pdfplumber.open.
+    """
+    return _StubPDF([
+        _StubPage(
+            "Gesellschafterliste\n"
+            "1. Max Mustermann, geb. 01.01.1980\n"
+            "2. Alpha Holding GmbH\n"
+        )
+    ])
+
+
+@pytest.fixture(scope="session")
+def fake_pdf_bytes():
+    """Minimal PDF stand-in: only the magic bytes are ever checked."""
+    return b"%PDF-1.4 test"
+
+
+@pytest.fixture(scope="session")
+def dummy_tif(tmp_path_factory):
+    """Placeholder TIF file for OCR tests.
+
+    The content is irrelevant: _extract_text_from_tif only forwards the
+    path to the (mocked) Image.open.
+    """
+    tif_file = tmp_path_factory.mktemp("ocr") / "scan.tif"
+    tif_file.write_bytes(b"\x00" * 100)
+    return tif_file
+
+
+@pytest.fixture
+def fake_image():
+    """Stand-in for a PIL image object."""
+    return MagicMock()
+
+
+@pytest.fixture
+def fake_pil(fake_image):
+    """Stand-in for PIL.Image whose open() returns fake_image."""
+    mock_pil_image = MagicMock()
+    mock_pil_image.open.return_value = fake_image
+    return mock_pil_image
+
+
+@pytest.fixture
+def fake_pytesseract():
+    """Stand-in for pytesseract returning a single recognized shareholder line."""
+    mock_pytesseract = MagicMock()
+    mock_pytesseract.image_to_string.return_value = "Max Mustermann 01.01.1980"
+    return mock_pytesseract
+
+
 @pytest.fixture
 def sample_company():
     """Returns a sample Company for testing."""
@@ -133,3 +263,48 @@ def malformed_csv(tmp_path):
         writer.writerow(["Spalte1", "Spalte2", "Spalte3"])
         writer.writerow(["Wert1", "Wert2", "Wert3"])
     return csv_path
+
+
+@pytest.fixture(scope="session")
+def aged_file():
+    """Factory for files with a given absolute mtime in epoch nanoseconds.
+
+    Creates, writes and back-dates the file through a single file
+    descriptor instead of write_bytes() followed by os.utime(path).
+    Without data the file stays empty and no write() is issued.
+    """
+    # Bound once per session; the stress test calls _make 10,000 times
+    _open, _write, _close, _utime = os.open, os.write, os.close, os.utime
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    utime_fd = os.utime in os.supports_fd
+
+    def _make(path: Path, mtime_ns: int, data: Optional[bytes] = None) -> Path:
+        fd = _open(path, flags, 0o644)
+        try:
+            if data:
+                _write(fd, data)
+            if utime_fd:
+                _utime(fd, ns=(mtime_ns, mtime_ns))
+        finally:
+            _close(fd)
+        if not utime_fd:  # e.g. Windows
+            _utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def aged_pdf_dir(tmp_path_factory, aged_file):
+    """Read-only reference tree with one 100-day-old file per media type.
+
+    Tests hardlink these into their own tmp_path (os.link keeps the inode
+    and therefore the mtime) instead of writing and back-dating new files.
+    cleanup_old_pdfs() only unlinks the test's name, so the tree stays intact.
+    """
+    root = tmp_path_factory.mktemp("aged")
+    mtime_ns = time.time_ns() - 100 * 86400 * 10**9
+    aged_file(root / "old.pdf", mtime_ns)
+    aged_file(root / "old.tif", mtime_ns)
+    aged_file(root / "old.tiff", mtime_ns)
+    return root
@@ -6,6 +6,7 @@ export functionality, and edge cases for the Database class.
 """
 
 import csv
+import sqlite3
 import pytest
 from pathlib import Path
 
@@ -15,9 +16,9 @@ from models import Database, Company, Shareholder
 class TestDatabase:
     """Tests for Database class."""
 
-    def test_init_creates_tables(self, temp_db):
+    def test_init_creates_tables(self, schema_db):
         """Database initialization creates all required tables."""
-        cursor = temp_db.conn.execute(
+        cursor = schema_db.conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table'"
         )
         tables = {row[0] for row in cursor.fetchall()}
@@ -26,9 +27,9 @@ class TestDatabase:
         assert "shareholders" in tables
         assert "pipeline_log" in tables
 
-    def test_init_creates_indexes(self, temp_db):
+    def test_init_creates_indexes(self, schema_db):
         """Database initialization creates performance indexes."""
-        cursor = temp_db.conn.execute(
+        cursor = schema_db.conn.execute(
             "SELECT name FROM sqlite_master WHERE type='index'"
         )
         indexes = {row[0] for row in cursor.fetchall()}
@@ -36,6 +37,37 @@ class TestDatabase:
         assert "idx_companies_qualified" in indexes
         assert "idx_companies_pipeline" in indexes
         assert "idx_shareholders_company" in indexes
+        assert "idx_pending_dl" in indexes
+
+    def test_pending_downloads_uses_partial_index(self, schema_db):
+        """The pending-downloads filter is answered via idx_pending_dl."""
+        plan = schema_db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM companies "
+            "WHERE dk_downloaded = FALSE AND register_num IS NOT NULL "
+            "AND register_num != '' ORDER BY id"
+        ).fetchall()
+
+        assert any("idx_pending_dl" in row[3] for row in plan)
+
+    def test_pending_parsing_uses_pipeline_index(self, schema_db):
+        """The pending-parsing filter is an index seek on idx_companies_pipeline."""
+        plan = schema_db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM companies "
+            "WHERE dk_downloaded = TRUE AND pdf_parsed = FALSE "
+            "AND pdf_path IS NOT NULL ORDER BY id"
+        ).fetchall()
+
+        assert any("idx_companies_pipeline" in row[3] for row in plan)
+
+    def test_init_enables_wal_and_read_only_connection(self, temp_db):
+        """Writer runs in WAL mode; the query connection rejects writes."""
+        mode = temp_db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            temp_db.ro_conn.execute(
+                "INSERT INTO companies (name) VALUES ('Nope GmbH')"
+            )
 
     def test_insert_company(self, temp_db):
         """Inserting a company returns a positive ID and persists data."""
@@ -68,9 +100,23 @@ class TestDatabase:
 
         assert id1 == id2
 
-        count = temp_db.conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
+        count = temp_db.scalar("SELECT COUNT(*) FROM companies")
         assert count == 1
 
+    def test_insert_companies(self, temp_db):
+        """insert_companies bulk-inserts companies and skips duplicates."""
+        companies = [
+            Company(name="Firma A", register_num="HRB 111"),
+            Company(name="Firma B", register_num="HRB 222"),
+            Company(name="Firma A", register_num="HRB 111"),
+        ]
+
+        inserted = temp_db.insert_companies(companies)
+        assert inserted == 2
+
+        count = temp_db.scalar("SELECT COUNT(*) FROM companies")
+        assert count == 2
+
     def test_get_pending_downloads(self, temp_db):
         """get_pending_downloads returns only companies with register_num and not yet downloaded."""
         # Company with register number -- should appear
@@ -81,10 +127,9 @@ class TestDatabase:
 
         # Already downloaded -- should NOT appear
         temp_db.insert_company(Company(name="Firma C", register_num="HRB 333"))
-        temp_db.conn.execute(
+        temp_db.update_flag(
             "UPDATE companies SET dk_downloaded = TRUE WHERE name = 'Firma C'"
         )
-        temp_db.conn.commit()
 
         pending = temp_db.get_pending_downloads()
 
@@ -93,14 +138,36 @@ class TestDatabase:
 
     def test_get_pending_downloads_with_limit(self, temp_db):
         """get_pending_downloads respects the limit parameter."""
-        for i in range(5):
-            temp_db.insert_company(
+        with temp_db.bulk_load():
+            temp_db.insert_companies(
                 Company(name=f"Firma {i}", register_num=f"HRB {1000 + i}")
+                for i in range(5)
             )
 
         pending = temp_db.get_pending_downloads(limit=2)
         assert len(pending) == 2
 
+    def test_bulk_load_drops_and_recreates_indexes(self, temp_db):
+        """bulk_load removes secondary indexes inside the block and restores them."""
+        def index_names():
+            return {
+                row[0] for row in temp_db.conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+                )
+            }
+
+        before = index_names()
+
+        with temp_db.bulk_load():
+            assert index_names() == set()
+            temp_db.insert_company(Company(name="Firma A", register_num="HRB 1"))
+            # UNIQUE constraint still rejects duplicates during the load
+            temp_db.insert_company(Company(name="Firma A", register_num="HRB 1"))
+
+        assert index_names() == before
+        count = temp_db.scalar("SELECT COUNT(*) FROM companies")
+        assert count == 1
+
     def test_get_pending_parsing(self, temp_db):
         """get_pending_parsing returns only downloaded but unparsed companies with pdf_path."""
         # Downloaded with pdf_path, not parsed -- should appear
@@ -119,13 +186,28 @@ class TestDatabase:
         assert len(pending) == 1
         assert pending[0].name == "Firma A"
 
+    def test_get_pending_parsing_row_types(self, temp_db):
+        """Pending companies carry bool flags and empty strings instead of NULL."""
+        cid = temp_db.insert_company(Company(name="Firma A", register_num="HRB 100"))
+        temp_db.update_flag("UPDATE companies SET city = NULL WHERE id = ?", (cid,))
+        temp_db.update_download_status(cid, "/tmp/a.pdf", True)
+
+        company = temp_db.get_pending_parsing()[0]
+
+        assert company.id == cid
+        assert company.city == ""
+        assert company.dk_downloaded is True
+        assert company.pdf_parsed is False
+        assert company.is_qualified is None
+
     def test_get_pending_parsing_with_limit(self, temp_db):
         """get_pending_parsing respects the limit parameter."""
-        for i in range(5):
-            cid = temp_db.insert_company(
-                Company(name=f"Firma {i}", register_num=f"HRB {2000 + i}")
-            )
-            temp_db.update_download_status(cid, f"/tmp/{i}.pdf", True)
+        temp_db.insert_companies(
+            Company(name=f"Firma {i}", register_num=f"HRB {2000 + i}")
+            for i in range(5)
+        )
+        for company in temp_db.get_pending_downloads():
+            temp_db.update_download_status(company.id, f"/tmp/{company.id}.pdf", True)
 
         pending = temp_db.get_pending_parsing(limit=3)
         assert len(pending) == 3
@@ -187,10 +269,10 @@ class TestDatabase:
         assert row["is_qualified"] == 1  # <=2 natural, 0 legal
         assert row["pdf_parsed"] == 1
 
-        sh_count = temp_db.conn.execute(
+        sh_count = temp_db.scalar(
             "SELECT COUNT(*) FROM shareholders WHERE company_id = ?",
             (company_id,),
-        ).fetchone()[0]
+        )
         assert sh_count == 2
 
     def test_update_parsing_result_not_qualified(self, temp_db):
@@ -215,6 +297,40 @@ class TestDatabase:
         ).fetchone()
         assert row["is_qualified"] == 0
 
+    def test_bulk_update_parsing_results(self, temp_db):
+        """bulk_update_parsing_results stores several companies in one call."""
+        cid_a = temp_db.insert_company(Company(name="Firma A", register_num="HRB 1"))
+        cid_b = temp_db.insert_company(Company(name="Firma B", register_num="HRB 2"))
+
+        temp_db.bulk_update_parsing_results([
+            (cid_a, 1, 0, 0.9, [Shareholder(name="Max Mustermann", source="table")]),
+            (cid_b, 1, 1, 0.8, [
+                Shareholder(name="Erika Musterfrau", source="table"),
+                Shareholder(name="Alpha Holding GmbH", is_natural_person=False, source="table"),
+            ]),
+        ])
+
+        rows = temp_db.conn.execute(
+            "SELECT id, is_qualified, pdf_parsed FROM companies ORDER BY id"
+        ).fetchall()
+        assert [tuple(r) for r in rows] == [(cid_a, 1, 1), (cid_b, 0, 1)]
+
+        sh_count = temp_db.scalar("SELECT COUNT(*) FROM shareholders")
+        assert sh_count == 3
+
+    def test_update_flag(self, temp_db):
+        """update_flag applies a one-off UPDATE and reports the affected rows."""
+        temp_db.insert_companies(
+            Company(name=f"Firma {i}", register_num=f"HRB {i}") for i in range(3)
+        )
+
+        changed = temp_db.update_flag(
+            "UPDATE companies SET dk_downloaded = TRUE WHERE name != ?", ("Firma 0",)
+        )
+
+        assert changed == 2
+        assert temp_db.get_stats()["downloaded"] == 2
+
     def test_log_event(self, temp_db):
         """log_event persists an event in the pipeline_log table."""
         company_id = temp_db.insert_company(
@@ -222,6 +338,7 @@ class TestDatabase:
         )
 
         temp_db.log_event(company_id, "download", "success", "Downloaded OK")
+        temp_db.flush_log()
 
         row = temp_db.conn.execute(
             "SELECT company_id, stage, status, message FROM pipeline_log WHERE company_id = ?",
@@ -241,24 +358,46 @@ class TestDatabase:
 
         temp_db.log_event(company_id, "download", "error", "Timeout")
         temp_db.log_event(company_id, "download", "success", "Retry OK")
+        temp_db.flush_log()
 
-        count = temp_db.conn.execute(
+        count = temp_db.scalar(
             "SELECT COUNT(*) FROM pipeline_log WHERE company_id = ?",
             (company_id,),
-        ).fetchone()[0]
+        )
         assert count == 2
 
+    def test_log_event_buffered_until_threshold(self, temp_db):
+        """Events are written once LOG_FLUSH_THRESHOLD entries are buffered."""
+        for i in range(temp_db.LOG_FLUSH_THRESHOLD - 1):
+            temp_db.log_event(i, "download", "success")
+        assert temp_db.scalar("SELECT COUNT(*) FROM pipeline_log") == 0
+
+        temp_db.log_event(0, "download", "success")
+        assert temp_db.scalar("SELECT COUNT(*) FROM pipeline_log") == temp_db.LOG_FLUSH_THRESHOLD
+
+    def test_close_flushes_log_buffer(self, tmp_path):
+        """close() writes buffered events before shutting down."""
+        db_path = tmp_path / "log.db"
+        db = Database(str(db_path))
+        db.log_event(1, "parse", "success")
+        db.close()
+
+        reopened = Database(str(db_path))
+        try:
+            assert reopened.scalar("SELECT COUNT(*) FROM pipeline_log") == 1
+        finally:
+            reopened.close()
+
     def test_get_stats(self, temp_db):
         """get_stats returns correct aggregate counts."""
-        for i in range(3):
-            temp_db.insert_company(
-                Company(name=f"Firma {i}", register_num=f"HRB {i}")
-            )
+        temp_db.insert_companies(
+            Company(name=f"Firma {i}", register_num=f"HRB {i}")
+            for i in range(3)
+        )
 
-        temp_db.conn.execute(
+        temp_db.update_flag(
             "UPDATE companies SET dk_downloaded = TRUE WHERE name = 'Firma 0'"
         )
-        temp_db.conn.commit()
 
         stats = temp_db.get_stats()
 
@@ -330,6 +469,45 @@ class TestDatabase:
             lines = f.readlines()
         assert len(lines) == 1  # header only
 
+    def test_export_qualified_aggregates_natural_shareholders(self, temp_db, tmp_path):
+        """Natural-person shareholders are joined into one column; legal persons are left out."""
+        company_id = temp_db.insert_company(Company(name="Beta GmbH", register_num="HRB 2"))
+        temp_db.update_parsing_result(
+            company_id,
+            natural_count=2,
+            legal_count=0,
+            confidence=0.8,
+            shareholders=[
+                Shareholder(name="Max Mustermann", is_natural_person=True),
+                Shareholder(name="Erika Musterfrau", is_natural_person=True),
+                Shareholder(name="Holding GmbH", is_natural_person=False),
+            ],
+        )
+
+        output_path = tmp_path / "aggregated.csv"
+        temp_db.export_qualified(str(output_path))
+
+        with open(output_path, encoding="utf-8") as f:
+            rows = list(csv.reader(f, delimiter=";"))
+        assert len(rows) == 2
+        assert sorted(rows[1][8].split("; ")) == ["Erika Musterfrau", "Max Mustermann"]
+
+    def test_export_qualified_streams_in_batches(self, temp_db, tmp_path, monkeypatch):
+        """Rows spanning several fetchmany() batches are all written and counted."""
+        monkeypatch.setattr(Database, "EXPORT_BATCH_SIZE", 2)
+        temp_db.insert_companies(
+            Company(name=f"Firma {i}", register_num=f"HRB {i}") for i in range(5)
+        )
+        temp_db.update_flag("UPDATE companies SET is_qualified = TRUE")
+
+        output_path = tmp_path / "batched.csv"
+        count = temp_db.export_qualified(str(output_path))
+
+        with open(output_path, encoding="utf-8") as f:
+            rows = list(csv.reader(f, delimiter=";"))
+        assert count == 5
+        assert [r[1] for r in rows[1:]] == [f"Firma {i}" for i in range(5)]
+
     def test_close(self, temp_db):
         """close() shuts down the database connection without errors."""
         temp_db.close()
@@ -342,20 +520,20 @@ class TestDatabase:
 
     def test_execute_with_limit_valid(self, temp_db):
         """_execute_with_limit with a valid positive integer limit returns correct rows."""
-        for i in range(5):
-            temp_db.insert_company(
-                Company(name=f"Firma {i}", register_num=f"HRB {3000 + i}")
-            )
+        temp_db.insert_companies(
+            Company(name=f"Firma {i}", register_num=f"HRB {3000 + i}")
+            for i in range(5)
+        )
 
         rows = temp_db._execute_with_limit("SELECT * FROM companies", limit=3)
         assert len(rows) == 3
 
     def test_execute_with_limit_none(self, temp_db):
         """_execute_with_limit with limit=None returns all rows."""
-        for i in range(3):
-            temp_db.insert_company(
-                Company(name=f"Firma {i}", register_num=f"HRB {4000 + i}")
-            )
+        temp_db.insert_companies(
+            Company(name=f"Firma {i}", register_num=f"HRB {4000 + i}")
+            for i in range(3)
+        )
 
         rows = temp_db._execute_with_limit("SELECT * FROM companies")
         assert len(rows) == 3
@@ -375,6 +553,19 @@ class TestDatabase:
         with pytest.raises(ValueError, match="Invalid limit"):
             temp_db._execute_with_limit("SELECT * FROM companies", limit="five")
 
+    @pytest.mark.parametrize("limit", [[1], {}], ids=["list", "dict"])
+    def test_execute_with_limit_unhashable(self, temp_db, limit):
+        """_execute_with_limit with an unhashable limit raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid limit"):
+            temp_db._execute_with_limit("SELECT * FROM companies", limit=limit)
+
+    def test_execute_with_limit_float_after_cached_int(self, temp_db):
+        """A cached valid int limit does not make the equal float valid."""
+        temp_db._execute_with_limit("SELECT * FROM companies", limit=3)
+
+        with pytest.raises(ValueError, match="Invalid limit"):
+            temp_db._execute_with_limit("SELECT * FROM companies", limit=3.0)
+
     def test_execute_with_limit_large_value(self, temp_db):
         """_execute_with_limit with limit > 10000 raises ValueError."""
         with pytest.raises(ValueError, match="exceeds maximum"):
@@ -427,6 +618,10 @@ class TestCompanyDataclass:
         assert company.name == "Test GmbH"
         assert company.is_qualified is True
 
+    def test_uses_slots(self):
+        """Company instances use __slots__ instead of a per-instance dict."""
+        assert not hasattr(Company(), "__dict__")
+
 
 class TestShareholderDataclass:
     """Tests for Shareholder dataclass."""
@@ -455,3 +650,11 @@ class TestShareholderDataclass:
         assert sh.name == "Max Mustermann"
         assert sh.share_percent == 50.0
         assert sh.source == "table"
+
+    def test_uses_slots_and_stays_mutable(self):
+        """Shareholder uses __slots__ but stays mutable for the parser's classification."""
+        sh = Shareholder(name="Alpha Holding GmbH")
+        sh.is_natural_person = False
+
+        assert not hasattr(sh, "__dict__")
+        assert sh.is_natural_person is False
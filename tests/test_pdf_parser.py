@@ -6,128 +6,112 @@ deduplication, confidence calculation, regex patterns, table parsing,
 column index finding, OCR fallback, and file-type handling.
 """
 
+import re
+
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from models import Shareholder
 from pdf_parser import GesellschafterlisteParser, ParsingResult
 
+# Markers that must never end up as shareholder names
+_BAD = re.compile(r"Geschaeftsanteil|Stammkapital|Geschäftsanteil")
 
-class TestIsNaturalPerson:
-    """Tests for _is_natural_person method."""
-
-    def test_natural_person_simple(self, parser):
-        """Simple two-word names are recognized as natural persons."""
-        assert parser._is_natural_person("Max Mustermann") is True
-        assert parser._is_natural_person("Erika Musterfrau") is True
-        assert parser._is_natural_person("Hans-Peter Mueller") is True
-
-    def test_gmbh_is_legal_entity(self, parser):
-        """GmbH variants are recognized as legal entities."""
-        assert parser._is_natural_person("Holding GmbH") is False
-        assert parser._is_natural_person("Muster Verwaltungs GmbH") is False
-        assert parser._is_natural_person("ABC GmbH & Co. KG") is False
-
-    def test_ag_is_legal_entity(self, parser):
-        """AG is recognized as legal entity."""
-        assert parser._is_natural_person("Deutsche Bank AG") is False
-        assert parser._is_natural_person("Siemens AG") is False
-
-    def test_other_legal_forms(self, parser):
-        """Other German legal forms are recognized."""
-        assert parser._is_natural_person("XYZ UG") is False
-        assert parser._is_natural_person("ABC KG") is False
-        assert parser._is_natural_person("Verein e.V.") is False
-        assert parser._is_natural_person("Muster Stiftung") is False
-
-    def test_holding_beteiligungs(self, parser):
-        """Holding/Beteiligungs/Verwaltungs keywords are detected."""
-        assert parser._is_natural_person("Muster Holding") is False
-        assert parser._is_natural_person("XYZ Beteiligungs") is False
-        assert parser._is_natural_person("ABC Verwaltungs") is False
-
-    def test_foreign_legal_forms(self, parser):
-        """Foreign legal forms (Ltd, BV, Inc) are detected."""
-        assert parser._is_natural_person("XYZ Ltd.") is False
-        assert parser._is_natural_person("ABC B.V.") is False
-        assert parser._is_natural_person("Company Inc.") is False
-
-    def test_too_many_words_not_natural(self, parser):
-        """Names with more than 5 words are classified as non-natural."""
-        long_name = "Erste Zweite Dritte Vierte Fuenfte Sechste"
-        assert parser._is_natural_person(long_name) is False
-
-    def test_name_with_digits_not_natural(self, parser):
-        """Names containing digits are classified as non-natural."""
-        assert parser._is_natural_person("Firma 123") is False
+# Shared read-only inputs for the confidence tests (_calculate_confidence never mutates them)
+_TABLE_SH = (Shareholder(name="Max", source="table"),)
+_REGEX_SH = (Shareholder(name="Max", source="regex:standard"),)
+_SMALL_SH = tuple(Shareholder(name=f"Person {i}") for i in range(3))
+_LARGE_SH = tuple(Shareholder(name=f"Person {i}") for i in range(15))
 
 
-class TestParseShare:
-    """Tests for _parse_share method."""
+@pytest.fixture(scope="module")
+def parsed_result(parser, tmp_path_factory, mock_pdfplumber_two_shareholders):
+    """ParsingResult of one mocked parse() call, shared by read-only checks."""
+    pdf_file = tmp_path_factory.mktemp("parse") / "test.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4 fake")
 
-    def test_percent_with_comma(self, parser):
-        """German percent format with comma as decimal separator."""
-        assert parser._parse_share("50,00 %") == 50.0
-        assert parser._parse_share("33,33%") == 33.33
-        assert parser._parse_share("100,00 %") == 100.0
+    with patch("pdf_parser.pdfplumber.open", return_value=mock_pdfplumber_two_shareholders):
+        return parser.parse(pdf_file)
 
-    def test_percent_with_dot(self, parser):
-        """English percent format with dot as decimal separator."""
-        assert parser._parse_share("50.00 %") == 50.0
-        assert parser._parse_share("25.5%") == 25.5
 
-    def test_eur_amount(self, parser):
-        """EUR amounts with German number formatting."""
-        result = parser._parse_share("25.000,00 EUR")
-        assert result == 25000.0
+class TestIsNaturalPerson:
+    """Tests for _is_natural_person method."""
 
-        result = parser._parse_share("12.500 EUR")
-        assert result == 12500.0
+    @pytest.mark.parametrize("name,expected", [
+        # Simple two-word names are natural persons
+        ("Max Mustermann", True),
+        ("Erika Musterfrau", True),
+        ("Hans-Peter Mueller", True),
+        ("Hans-Peter Müller", True),
+        # GmbH variants
+        ("Holding GmbH", False),
+        ("Muster Verwaltungs GmbH", False),
+        ("ABC GmbH & Co. KG", False),
+        # AG
+        ("Deutsche Bank AG", False),
+        ("Siemens AG", False),
+        # Other German legal forms
+        ("XYZ UG", False),
+        ("ABC KG", False),
+        ("Verein e.V.", False),
+        ("Muster Stiftung", False),
+        # Holding/Beteiligungs/Verwaltungs keywords
+        ("Muster Holding", False),
+        ("XYZ Beteiligungs", False),
+        ("ABC Verwaltungs", False),
+        # Foreign legal forms
+        ("XYZ Ltd.", False),
+        ("ABC B.V.", False),
+        ("Company Inc.", False),
+        # More than 5 words
+        ("Erste Zweite Dritte Vierte Fuenfte Sechste", False),
+        # Digits
+        ("Firma 123", False),
+    ])
+    def test_is_natural_person(self, parser, name, expected):
+        """Names are classified as natural person or legal entity."""
+        assert parser._is_natural_person(name) is expected
 
-    def test_eur_symbol(self, parser):
-        """EUR symbol instead of text."""
-        # Note: "12.500 EUR" -> interpreted as 12500 (German format)
-        result = parser._parse_share("12.500 \u20ac")
-        assert result == 12500.0
 
-    def test_empty_string(self, parser):
-        """Empty string returns None."""
-        assert parser._parse_share("") is None
-        assert parser._parse_share(None) is None
+class TestParseShare:
+    """Tests for _parse_share method."""
 
-    def test_no_number(self, parser):
-        """String without recognizable number returns None."""
-        assert parser._parse_share("keine Angabe") is None
+    @pytest.mark.parametrize("share_str,expected", [
+        # German percent format with comma as decimal separator
+        ("50,00 %", 50.0),
+        ("33,33%", 33.33),
+        ("100,00 %", 100.0),
+        # English percent format with dot as decimal separator
+        ("50.00 %", 50.0),
+        ("25.5%", 25.5),
+        # EUR amounts with German number formatting
+        ("25.000,00 EUR", 25000.0),
+        ("12.500 EUR", 12500.0),
+        # EUR symbol instead of text
+        ("12.500 \u20ac", 12500.0),
+        # No recognizable number
+        ("keine Angabe", None),
+    ])
+    def test_parse_share(self, parser, share_str, expected):
+        """Share strings are parsed into percent/EUR values or None."""
+        assert parser._parse_share(share_str) == expected
 
 
 class TestCleanName:
     """Tests for _clean_name method."""
 
-    def test_trim_whitespace(self, parser):
-        """Leading and trailing whitespace is removed."""
-        assert parser._clean_name("  Max Mustermann  ") == "Max Mustermann"
-
-    def test_multiple_spaces(self, parser):
-        """Multiple spaces are collapsed to single space."""
-        assert parser._clean_name("Max   Mustermann") == "Max Mustermann"
-
-    def test_trailing_comma(self, parser):
-        """Trailing comma is removed."""
-        assert parser._clean_name("Max Mustermann,") == "Max Mustermann"
-
-    def test_combined_issues(self, parser):
-        """Multiple formatting issues are fixed simultaneously.
-
-        Note: _clean_name strips whitespace, collapses spaces, then strips
-        trailing comma. 'Max Mustermann ,' becomes 'Max Mustermann ' because
-        rstrip(',') only removes the comma, not the preceding space.
-        """
-        result = parser._clean_name("  Max   Mustermann , ")
-        # Space before comma remains after rstrip(',')
-        assert result == "Max Mustermann "
-        # A simpler input without space-before-comma works cleanly
-        assert parser._clean_name("  Max   Mustermann,  ") == "Max Mustermann"
+    @pytest.mark.parametrize("raw,expected", [
+        ("  Max Mustermann  ", "Max Mustermann"),
+        ("Max   Mustermann", "Max Mustermann"),
+        ("Max Mustermann,", "Max Mustermann"),
+        ("  Max   Mustermann,  ", "Max Mustermann"),
+        # rstrip(',') only removes the comma, not the preceding space
+        ("  Max   Mustermann , ", "Max Mustermann "),
+    ], ids=["trim", "multiple_spaces", "trailing_comma", "combined", "space_before_comma"])
+    def test_clean_name(self, parser, raw, expected):
+        """Whitespace is trimmed and collapsed, trailing commas are removed."""
+        assert parser._clean_name(raw) == expected
 
 
 class TestDeduplicate:
@@ -168,25 +152,14 @@ class TestDeduplicate:
         result = parser._deduplicate(shareholders)
         assert len(result) == 2
 
-    def test_empty_list(self, parser):
-        """Empty list returns empty list."""
-        assert parser._deduplicate([]) == []
-
 
 class TestCalculateConfidence:
     """Tests for _calculate_confidence method."""
 
-    def test_empty_list_zero_confidence(self, parser):
-        """Empty shareholder list yields confidence 0.0."""
-        assert parser._calculate_confidence([], "") == 0.0
-
     def test_table_source_higher_than_regex(self, parser):
         """Table-sourced shareholders yield higher confidence than regex-sourced."""
-        table_sh = [Shareholder(name="Max", source="table")]
-        regex_sh = [Shareholder(name="Max", source="regex:standard")]
-
-        table_conf = parser._calculate_confidence(table_sh, "")
-        regex_conf = parser._calculate_confidence(regex_sh, "")
+        table_conf = parser._calculate_confidence(_TABLE_SH, "")
+        regex_conf = parser._calculate_confidence(_REGEX_SH, "")
 
         assert table_conf > regex_conf
 
@@ -208,29 +181,22 @@ class TestCalculateConfidence:
 
     def test_reasonable_count_bonus(self, parser):
         """1-10 shareholders get higher bonus than 11-20."""
-        sh_small = [Shareholder(name=f"Person {i}") for i in range(3)]
-        sh_large = [Shareholder(name=f"Person {i}") for i in range(15)]
-
-        conf_small = parser._calculate_confidence(sh_small, "")
-        conf_large = parser._calculate_confidence(sh_large, "")
+        conf_small = parser._calculate_confidence(_SMALL_SH, "")
+        conf_large = parser._calculate_confidence(_LARGE_SH, "")
 
         assert conf_small > conf_large
 
     def test_birth_date_in_text_increases_confidence(self, parser):
         """Birth date pattern in text increases confidence."""
-        sh = [Shareholder(name="Max", source="table")]
-
-        conf_with_date = parser._calculate_confidence(sh, "Max Mustermann * 01.01.1980")
-        conf_without_date = parser._calculate_confidence(sh, "Max Mustermann Berlin")
+        conf_with_date = parser._calculate_confidence(_TABLE_SH, "Max Mustermann * 01.01.1980")
+        conf_without_date = parser._calculate_confidence(_TABLE_SH, "Max Mustermann Berlin")
 
         assert conf_with_date > conf_without_date
 
     def test_gesellschafterliste_in_text_increases_confidence(self, parser):
         """The word 'gesellschafterliste' in text increases confidence."""
-        sh = [Shareholder(name="Max", source="table")]
-
-        conf_with = parser._calculate_confidence(sh, "Gesellschafterliste der Firma")
-        conf_without = parser._calculate_confidence(sh, "Dokument der Firma")
+        conf_with = parser._calculate_confidence(_TABLE_SH, "Gesellschafterliste der Firma")
+        conf_without = parser._calculate_confidence(_TABLE_SH, "Dokument der Firma")
 
         assert conf_with > conf_without
 
@@ -249,39 +215,26 @@ class TestCalculateConfidence:
 class TestRegexPatterns:
     """Tests for regex pattern matching."""
 
-    def test_standard_birth_pattern(self, parser):
-        """Standard pattern: 'Nachname, Vorname, Ort, *DD.MM.YYYY'."""
-        text = "Mustermann, Max, Berlin, *01.01.1980"
-        matches = parser.PATTERNS["standard_birth"].findall(text)
-
-        assert len(matches) == 1
-        assert matches[0][0] == "Mustermann"
-        assert matches[0][1] == "Max"
-        assert matches[0][2] == "Berlin"
-        assert matches[0][3] == "01.01.1980"
-
-    def test_numbered_geb_pattern(self, parser):
-        """Numbered pattern: '1. Name, geb. DD.MM.YYYY'."""
-        text = "1. Max Mustermann, geb. 15.03.1975"
-        matches = parser.PATTERNS["numbered_geb"].findall(text)
-
-        assert len(matches) == 1
-        assert "Max Mustermann" in matches[0][0]
-
-    def test_name_share_pattern(self, parser):
-        """Name with share pattern: 'Name 50,00 %'."""
-        text = "Max Mustermann 50,00 %"
-        matches = parser.PATTERNS["name_share"].findall(text)
-
-        assert len(matches) == 1
-        assert "Max Mustermann" in matches[0][0]
-
-    def test_name_first_pattern(self, parser):
-        """Name-first pattern: 'Vorname Nachname, Ort, *DD.MM.YYYY'."""
-        text = "Max Mustermann, Berlin, *01.01.1980"
-        matches = parser.PATTERNS["name_first"].findall(text)
+    @pytest.mark.parametrize("key,text,expected", [
+        # 'Nachname, Vorname, Ort, *DD.MM.YYYY' -> all groups checked
+        ("standard_birth", "Mustermann, Max, Berlin, *01.01.1980",
+         ("Mustermann", "Max", "Berlin", "01.01.1980")),
+        # '1. Name, geb. DD.MM.YYYY'
+        ("numbered_geb", "1. Max Mustermann, geb. 15.03.1975", "Max Mustermann"),
+        # 'Name 50,00 %'
+        ("name_share", "Max Mustermann 50,00 %", "Max Mustermann"),
+        # 'Vorname Nachname, Ort, *DD.MM.YYYY' -> only the match count is checked
+        ("name_first", "Max Mustermann, Berlin, *01.01.1980", None),
+    ], ids=["standard_birth", "numbered_geb", "name_share", "name_first"])
+    def test_pattern(self, parser, key, text, expected):
+        """Each pattern finds exactly one match with the expected name groups."""
+        matches = parser.PATTERNS[key].findall(text)
 
         assert len(matches) == 1
+        if isinstance(expected, tuple):
+            assert matches[0] == expected
+        elif expected is not None:
+            assert expected in matches[0][0]
 
 
 class TestParseWithPatterns:
@@ -309,55 +262,23 @@ class TestParseWithPatterns:
         shareholders = parser._parse_with_patterns(text)
 
         names = [s.name for s in shareholders]
-        assert not any("Geschaeftsanteil" in n for n in names)
-        assert not any("Stammkapital" in n for n in names)
-
-    def test_empty_text(self, parser):
-        """Empty text yields empty list."""
-        shareholders = parser._parse_with_patterns("")
-        assert shareholders == []
+        assert not any(_BAD.search(n) for n in names)
 
 
 class TestFindColumnIndex:
     """Tests for _find_column_index method."""
 
-    def test_finds_exact_match(self, parser):
-        """Finds column by exact header match."""
-        headers = ["lfd nr", "name", "anteil", "bemerkung"]
-        idx = parser._find_column_index(headers, ["name", "gesellschafter"])
-        assert idx == 1
-
-    def test_finds_partial_match(self, parser):
-        """Finds column by substring match."""
-        headers = ["nr", "vor- und nachname", "geschaeftsanteil"]
-        idx = parser._find_column_index(headers, ["name", "gesellschafter"])
-        assert idx == 1
-
-    def test_returns_none_if_not_found(self, parser):
-        """Returns None when no header matches."""
-        headers = ["spalte1", "spalte2", "spalte3"]
-        idx = parser._find_column_index(headers, ["name", "gesellschafter"])
-        assert idx is None
-
-    def test_finds_share_column(self, parser):
-        """Finds share/percent column variants."""
-        headers = ["name", "anteil in %", "ort"]
-        idx = parser._find_column_index(headers, ["anteil", "%", "geschaeftsanteil"])
-        assert idx == 1
-
-    def test_empty_headers(self, parser):
-        """Empty headers list returns None."""
-        idx = parser._find_column_index([], ["name"])
-        assert idx is None
-
-    def test_none_in_headers(self, parser):
-        """None values in headers are handled gracefully."""
-        headers = [None, "name", None]
-        idx = parser._find_column_index(
-            [str(h).lower() if h else "" for h in headers],
-            ["name"],
-        )
-        assert idx == 1
+    @pytest.mark.parametrize("headers,search_terms,expected", [
+        (["lfd nr", "name", "anteil", "bemerkung"], ["name", "gesellschafter"], 1),
+        (["nr", "vor- und nachname", "geschaeftsanteil"], ["name", "gesellschafter"], 1),
+        (["spalte1", "spalte2", "spalte3"], ["name", "gesellschafter"], None),
+        (["name", "anteil in %", "ort"], ["anteil", "%", "geschaeftsanteil"], 1),
+        # None headers are normalized to "" by the caller
+        (["", "name", ""], ["name"], 1),
+    ], ids=["exact", "partial", "not_found", "share_column", "none_in_headers"])
+    def test_find_column_index(self, parser, headers, search_terms, expected):
+        """Finds the first header matching one of the search terms."""
+        assert parser._find_column_index(headers, search_terms) == expected
 
 
 class TestParseTable:
@@ -378,11 +299,6 @@ class TestParseTable:
         assert shareholders[1].name == "Erika Musterfrau"
         assert shareholders[0].source == "table"
 
-    def test_empty_table(self, parser):
-        """Empty table returns empty list."""
-        assert parser._parse_table([]) == []
-        assert parser._parse_table(None) == []
-
     def test_header_only_table(self, parser):
         """Table with only a header row returns empty list."""
         table = [["Name", "Anteil"]]
@@ -411,7 +327,7 @@ class TestParseTable:
         shareholders = parser._parse_table(table)
         names = [s.name for s in shareholders]
         assert "Max Mustermann" in names
-        assert not any("Stammkapital" in n for n in names)
+        assert not any(_BAD.search(n) for n in names)
 
     def test_table_without_name_header(self, parser):
         """Table without recognizable name header uses first non-number column."""
@@ -429,9 +345,9 @@ class TestParseTable:
 class TestParse:
     """Tests for the main parse() method."""
 
-    def test_nonexistent_file(self, parser, tmp_path):
+    def test_nonexistent_file(self, parser):
         """Parsing a non-existent file returns empty result with confidence 0."""
-        result = parser.parse(tmp_path / "does_not_exist.pdf")
+        result = parser.parse(Path("/__definitely_nonexistent__/does_not_exist.pdf"))
 
         assert isinstance(result, ParsingResult)
         assert result.shareholders == []
@@ -449,98 +365,45 @@ class TestParse:
         assert result.shareholders == []
         assert result.confidence == 0.0
 
-    def test_parse_sets_is_natural_person(self, parser, tmp_path):
+    def test_parse_sets_is_natural_person(self, parsed_result):
         """parse() classifies each shareholder as natural/legal person.
 
         Uses a mocked pdfplumber to avoid needing real PDF files.
         """
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = (
-            "Gesellschafterliste\n"
-            "1. Max Mustermann, geb. 01.01.1980\n"
-            "2. Alpha Holding GmbH\n"
-        )
-        mock_page.extract_tables.return_value = []
-
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_page]
-        mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
-        mock_pdf.__exit__ = MagicMock(return_value=False)
-
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4 fake")
-
-        with patch("pdf_parser.pdfplumber.open", return_value=mock_pdf):
-            result = parser.parse(pdf_file)
-
         # At least the natural person should be found
-        natural = [s for s in result.shareholders if s.is_natural_person]
+        natural = [s for s in parsed_result.shareholders if s.is_natural_person]
         assert len(natural) >= 1
 
 
 class TestExtractTextFromTif:
     """Tests for _extract_text_from_tif method (OCR)."""
 
-    def test_ocr_not_available(self, parser, tmp_path):
+    def test_ocr_not_available(self, parser, dummy_tif):
         """When OCR is not available, returns empty string."""
-        tif_file = tmp_path / "scan.tif"
-        tif_file.write_bytes(b"\x00" * 100)
-
         with patch("pdf_parser.OCR_AVAILABLE", False):
-            result = parser._extract_text_from_tif(tif_file)
+            result = parser._extract_text_from_tif(dummy_tif)
 
         assert result == ""
 
-    def test_ocr_available_success(self, parser, tmp_path):
+    def test_ocr_available_success(self, parser, dummy_tif, fake_pil, fake_pytesseract, monkeypatch):
         """When OCR is available, extracts text from image."""
-        import pdf_parser as pp
-
-        tif_file = tmp_path / "scan.tif"
-        tif_file.write_bytes(b"\x00" * 100)
-
-        mock_image = MagicMock()
-        mock_pytesseract = MagicMock()
-        mock_pytesseract.image_to_string.return_value = "Max Mustermann 01.01.1980"
-        mock_pil_image = MagicMock()
-        mock_pil_image.open.return_value = mock_image
-
-        # Temporarily inject the mocked modules into the pdf_parser namespace
-        original_ocr = pp.OCR_AVAILABLE
-        pp.OCR_AVAILABLE = True
-        pp.Image = mock_pil_image
-        pp.pytesseract = mock_pytesseract
-
-        try:
-            result = parser._extract_text_from_tif(tif_file)
-        finally:
-            pp.OCR_AVAILABLE = original_ocr
-            if hasattr(pp, "Image"):
-                del pp.Image
-            if hasattr(pp, "pytesseract"):
-                del pp.pytesseract
+        # monkeypatch restores the module globals, so workers stay isolated under xdist
+        monkeypatch.setattr("pdf_parser.OCR_AVAILABLE", True)
+        monkeypatch.setattr("pdf_parser.Image", fake_pil, raising=False)
+        monkeypatch.setattr("pdf_parser.pytesseract", fake_pytesseract, raising=False)
+
+        result = parser._extract_text_from_tif(dummy_tif)
 
         assert "Max Mustermann" in result
 
-    def test_ocr_exception_returns_empty(self, parser, tmp_path):
+    def test_ocr_exception_returns_empty(self, parser, dummy_tif, fake_pil, monkeypatch):
         """OCR exception returns empty string gracefully."""
-        import pdf_parser as pp
-
-        tif_file = tmp_path / "bad_scan.tif"
-        tif_file.write_bytes(b"\x00" * 100)
-
-        mock_pil_image = MagicMock()
-        mock_pil_image.open.side_effect = Exception("Corrupt image")
+        fake_pil.open.side_effect = Exception("Corrupt image")
 
-        original_ocr = pp.OCR_AVAILABLE
-        pp.OCR_AVAILABLE = True
-        pp.Image = mock_pil_image
+        monkeypatch.setattr("pdf_parser.OCR_AVAILABLE", True)
+        monkeypatch.setattr("pdf_parser.Image", fake_pil, raising=False)
 
-        try:
-            result = parser._extract_text_from_tif(tif_file)
-        finally:
-            pp.OCR_AVAILABLE = original_ocr
-            if hasattr(pp, "Image"):
-                del pp.Image
+        result = parser._extract_text_from_tif(dummy_tif)
 
         assert result == ""
 
@@ -568,3 +431,26 @@ class TestParsingResultDataclass:
         assert result.natural_persons_count == 1
         assert result.confidence == 0.85
         assert result.raw_text == "sample text"
+
+
+class TestEmptyInputs:
+    """Empty input yields an empty/None/0 result across all parser helpers."""
+
+    @pytest.mark.parametrize("fn_name,arg,expected", [
+        ("_parse_share", "", None),
+        ("_parse_share", None, None),
+        ("_deduplicate", [], []),
+        ("_find_column_index", ([], ["name"]), None),
+        ("_calculate_confidence", ([], ""), 0.0),
+        ("_parse_table", [], []),
+        ("_parse_table", None, []),
+        ("_parse_with_patterns", "", []),
+    ], ids=[
+        "share_empty", "share_none", "deduplicate", "column_index",
+        "confidence", "table_empty", "table_none", "patterns",
+    ])
+    def test_empty_inputs(self, parser, fn_name, arg, expected):
+        """Tuple args are unpacked as positional arguments."""
+        fn = getattr(parser, fn_name)
+        result = fn(*arg) if isinstance(arg, tuple) else fn(arg)
+        assert result == expected
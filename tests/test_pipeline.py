@@ -6,147 +6,106 @@ field resolution, export, download orchestration (mocked), parsing
 orchestration (mocked), and full pipeline integration (mocked).
 """
 
+import contextlib
 import csv
+import io
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from dk_downloader import DownloadResult
 from models import Company, Shareholder
+from pdf_parser import ParsingResult
 from pipeline import GFScreeningPipeline
 
 
+def _make_pdf(pipeline, name, data):
+    """Writes a fake PDF into the pipeline's PDF directory and returns its path."""
+    path = pipeline.pdf_dir / name
+    path.write_bytes(data)
+    return path
+
+
 class TestParseRegisterField:
     """Tests for _parse_register_field method."""
 
     @pytest.fixture
-    def pipeline(self, temp_pipeline):
-        return temp_pipeline
-
-    def test_hrb_with_spaces(self, pipeline):
-        """'HRB 12345' is parsed into type='HRB', num='12345'."""
-        reg_type, reg_num, court = pipeline._parse_register_field("HRB 12345", "Berlin")
-
-        assert reg_type == "HRB"
-        assert reg_num == "12345"
-
-    def test_hrb_without_spaces(self, pipeline):
-        """'HRB12345' (no space) is correctly parsed."""
-        reg_type, reg_num, court = pipeline._parse_register_field("HRB12345", "Berlin")
-
-        assert reg_type == "HRB"
-        assert reg_num == "12345"
-
-    def test_hrb_with_suffix(self, pipeline):
-        """'HRB 175642 B' includes the suffix in reg_num."""
-        reg_type, reg_num, court = pipeline._parse_register_field("HRB 175642 B", "Berlin")
-
-        assert reg_type == "HRB"
-        assert "175642" in reg_num
-        assert "B" in reg_num
-
-    def test_hra_register(self, pipeline):
-        """HRA register type is correctly recognized."""
-        reg_type, reg_num, court = pipeline._parse_register_field("HRA 7834", "Dortmund")
-
-        assert reg_type == "HRA"
-        assert reg_num == "7834"
-
-    def test_only_number(self, pipeline):
-        """Bare number defaults to HRB type."""
-        reg_type, reg_num, court = pipeline._parse_register_field("12345", "Hamburg")
-
-        assert reg_type == "HRB"
-        assert reg_num == "12345"
-
-    def test_with_court_prefix(self, pipeline):
-        """'Amtsgericht Muenchen HRB 12345' extracts court from prefix."""
-        reg_type, reg_num, court = pipeline._parse_register_field(
-            "Amtsgericht Muenchen HRB 12345", ""
-        )
-
-        assert reg_type == "HRB"
-        assert reg_num == "12345"
+    def pipeline(self, ro_pipeline):
+        return ro_pipeline
+
+    @pytest.mark.parametrize("register_raw,city,exp_type,exp_num", [
+        ("HRB 12345", "Berlin", "HRB", "12345"),
+        ("HRB12345", "Berlin", "HRB", "12345"),  # no space
+        ("hrb 12345", "Berlin", "HRB", "12345"),  # lowercase is normalized to uppercase
+        ("HRB 175642 B", "Berlin", "HRB", "175642 B"),  # suffix is kept in reg_num
+        ("HRA 7834", "Dortmund", "HRA", "7834"),
+        ("12345", "Hamburg", "HRB", "12345"),  # bare number defaults to HRB
+        ("VR 5678", "Berlin", "VR", "5678"),  # Vereine
+        ("GNR 9012", "Berlin", "GNR", "9012"),  # Genossenschaften
+        ("HRB\xa012345", "Berlin", "HRB", "12345"),  # non-breaking space from Excel
+        ("", "Berlin", "", ""),
+    ], ids=[
+        "with_spaces", "without_spaces", "lowercase", "with_suffix", "hra",
+        "only_number", "vr", "gnr", "nbsp", "empty",
+    ])
+    def test_parse_register(self, pipeline, register_raw, city, exp_type, exp_num):
+        """Register strings are split into register type and number."""
+        reg_type, reg_num, _ = pipeline._parse_register_field(register_raw, city)
+
+        assert (reg_type, reg_num) == (exp_type, exp_num)
+
+    @pytest.mark.parametrize("register_raw,expected", [
         # The regex captures the word before HRB as court
-        assert court == "MUENCHEN"
-
-    def test_empty_string(self, pipeline):
-        """Empty input returns empty strings."""
-        reg_type, reg_num, court = pipeline._parse_register_field("", "Berlin")
-
-        assert reg_type == ""
-        assert reg_num == ""
-
-    def test_lowercase_input(self, pipeline):
-        """Lowercase input is normalized to uppercase."""
-        reg_type, reg_num, court = pipeline._parse_register_field("hrb 12345", "Berlin")
-
-        assert reg_type == "HRB"
-        assert reg_num == "12345"
-
-    def test_vr_register(self, pipeline):
-        """VR register type (Vereine) is recognized."""
-        reg_type, reg_num, court = pipeline._parse_register_field("VR 5678", "Berlin")
-
-        assert reg_type == "VR"
-        assert reg_num == "5678"
-
-    def test_gnr_register(self, pipeline):
-        """GNR register type (Genossenschaften) is recognized."""
-        reg_type, reg_num, court = pipeline._parse_register_field("GNR 9012", "Berlin")
-
-        assert reg_type == "GNR"
-        assert reg_num == "9012"
+        ("Amtsgericht Muenchen HRB 12345", ("HRB", "12345", "MUENCHEN")),
+        # Umlauts in the court name are kept
+        ("Amtsgericht München HRB 12345", ("HRB", "12345", "MÜNCHEN")),
+        # Non-breaking space between court and register type
+        ("Berlin,\xa0HRB 5", ("HRB", "5", "BERLIN")),
+    ], ids=["ascii", "umlaut", "nbsp"])
+    def test_with_court_prefix(self, pipeline, register_raw, expected):
+        """'Amtsgericht <Ort> HRB ...' extracts the court from the prefix."""
+        assert pipeline._parse_register_field(register_raw, "") == expected
 
 
 class TestCityToCourt:
     """Tests for _city_to_court method."""
 
     @pytest.fixture
-    def pipeline(self, temp_pipeline):
-        return temp_pipeline
-
-    def test_berlin(self, pipeline):
-        """Berlin maps to 'Berlin (Charlottenburg)'."""
-        court = pipeline._city_to_court("Berlin")
-        assert court == "Berlin (Charlottenburg)"
-
-    def test_munich_german(self, pipeline):
-        """'Muenchen' maps to 'Muenchen'."""
-        court = pipeline._city_to_court("München")
-        assert court == "München"
-
-    def test_munich_english(self, pipeline):
-        """'Munich' also maps to 'Muenchen'."""
-        court = pipeline._city_to_court("Munich")
-        assert court == "München"
-
-    def test_hamburg(self, pipeline):
-        """Hamburg maps to 'Hamburg'."""
-        court = pipeline._city_to_court("Hamburg")
-        assert court == "Hamburg"
-
-    def test_cologne_english(self, pipeline):
-        """'Cologne' maps to 'Koeln'."""
-        court = pipeline._city_to_court("Cologne")
-        assert court == "Köln"
-
-    def test_unknown_city_fallback(self, pipeline):
-        """Unknown city returns the city name itself as fallback."""
-        court = pipeline._city_to_court("Kleinkleckersdorf")
-        assert court == "Kleinkleckersdorf"
-
-    def test_empty_city(self, pipeline):
-        """Empty string returns empty string."""
-        court = pipeline._city_to_court("")
-        assert court == ""
+    def pipeline(self, ro_pipeline):
+        return ro_pipeline
+
+    @pytest.mark.parametrize("city,expected", [
+        ("Berlin", "Berlin (Charlottenburg)"),
+        ("München", "München"),
+        ("Munich", "München"),
+        ("Hamburg", "Hamburg"),
+        ("Cologne", "Köln"),
+        # Umlaut transliterations and longer city strings
+        ("Muenchen", "München"),
+        ("Düsseldorf", "Düsseldorf"),
+        ("Frankfurt am Main", "Frankfurt am Main"),
+        ("80331 München", "München"),
+        # Unknown city falls back to the city name itself
+        ("Kleinkleckersdorf", "Kleinkleckersdorf"),
+        # "giessen" contains "essen" but is a different city
+        ("Gießen", "Gießen"),
+        ("", ""),
+    ], ids=[
+        "berlin", "munich_german", "munich_english", "hamburg", "cologne_english",
+        "transliterated", "duesseldorf", "partial_name", "postcode_prefix",
+        "unknown_fallback", "giessen_not_essen", "empty",
+    ])
+    def test_city_to_court(self, pipeline, city, expected):
+        """Cities map to their register court."""
+        assert pipeline._city_to_court(city) == expected
 
 
 class TestGetField:
     """Tests for _get_field method."""
 
     @pytest.fixture
-    def pipeline(self, temp_pipeline):
-        return temp_pipeline
+    def pipeline(self, ro_pipeline):
+        return ro_pipeline
 
     def test_finds_exact_match(self, pipeline):
         """Finds exact column name from candidates list."""
@@ -250,6 +209,93 @@ class TestImportCsv:
         stats = pipeline.db.get_stats()
         assert stats["total"] == 1
 
+    def test_import_csv_semicolon_in_value_of_comma_csv(self, pipeline, tmp_path):
+        """A ';' inside a value does not override the comma used in the header."""
+        csv_path = tmp_path / "comma_with_semicolon.csv"
+        with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f, delimiter=",")
+            writer.writerow(["Firma", "Ort", "Registernummer", "ID"])
+            for i in range(60):
+                writer.writerow([f"Firma {i} GmbH", "Berlin", f"HRB {i}", f"DF{i}"])
+            writer.writerow(["Foo; Bar GmbH", "Berlin", "HRB 999", "DF999"])
+
+        pipeline.import_file(str(csv_path))
+
+        stats = pipeline.db.get_stats()
+        assert stats["total"] == 61
+
+    def test_import_csv_keeps_custom_delimiter(self, pipeline, tmp_path):
+        """An explicit non-standard delimiter wins over a stray comma in the header."""
+        csv_path = tmp_path / "pipe.csv"
+        csv_path.write_text(
+            "Firma|Company Name, Inc|Ort\n"
+            "Theta GmbH||Bonn\n",
+            encoding="utf-8",
+        )
+
+        pipeline.import_file(str(csv_path), delimiter="|")
+
+        rows = pipeline.db.conn.execute("SELECT name, city FROM companies").fetchall()
+        assert [tuple(r) for r in rows] == [("Theta GmbH", "Bonn")]
+
+    def test_import_csv_detects_tab_delimiter(self, pipeline, tmp_path):
+        """import_file falls back to tab when neither ';' nor ',' is used."""
+        csv_path = tmp_path / "tab.csv"
+        with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f, delimiter="\t")
+            writer.writerow(["Firma", "Ort", "Registernummer", "ID"])
+            writer.writerow(["Eta GmbH", "Dortmund", "HRB 55555", "DF005"])
+
+        pipeline.import_file(str(csv_path))
+
+        rows = pipeline.db.conn.execute("SELECT name, city FROM companies").fetchall()
+        assert [tuple(r) for r in rows] == [("Eta GmbH", "Dortmund")]
+
+    def test_import_csv_merges_candidate_columns(self, pipeline, tmp_path):
+        """An empty primary column falls back to the next matching column."""
+        csv_path = tmp_path / "merge.csv"
+        with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f, delimiter=";")
+            writer.writerow(["Firma", "Company Name", "Ort"])
+            writer.writerow(["", "Epsilon GmbH", "Bremen"])
+            writer.writerow(["Zeta GmbH", "", "Essen"])
+
+        pipeline.import_file(str(csv_path))
+
+        rows = pipeline.db.conn.execute("SELECT name FROM companies ORDER BY name").fetchall()
+        assert [r["name"] for r in rows] == ["Epsilon GmbH", "Zeta GmbH"]
+
+    @pytest.mark.parametrize("has_pandas", [True, False], ids=["pandas", "csv-module"])
+    def test_import_csv_trailing_delimiter(self, pipeline, tmp_path, monkeypatch, has_pandas):
+        """Rows ending in a delimiter keep their columns aligned with the header."""
+        monkeypatch.setattr("pipeline.HAS_PANDAS", has_pandas)
+        csv_path = tmp_path / "trailing.csv"
+        csv_path.write_text(
+            "Firma;Ort;Registernummer\n"
+            "Alpha GmbH;Berlin;HRB 1;\n"
+            "Beta GmbH;Hamburg;HRB 2;\n",
+            encoding="utf-8",
+        )
+
+        pipeline.import_file(str(csv_path))
+
+        rows = pipeline.db.conn.execute(
+            "SELECT name, city, register_num FROM companies ORDER BY name"
+        ).fetchall()
+        assert [tuple(r) for r in rows] == [
+            ("Alpha GmbH", "Berlin", "HRB 1"),
+            ("Beta GmbH", "Hamburg", "HRB 2"),
+        ]
+
+    def test_import_csv_without_pandas(self, pipeline, sample_csv, monkeypatch):
+        """The csv module fallback imports the same rows when pandas is missing."""
+        monkeypatch.setattr("pipeline.HAS_PANDAS", False)
+
+        pipeline.import_file(str(sample_csv))
+
+        stats = pipeline.db.get_stats()
+        assert stats["total"] == 3
+
 
 class TestExport:
     """Tests for export functionality."""
@@ -366,10 +412,8 @@ class TestRunDownloads:
         assert stats["downloaded"] == 0
 
     @patch("pipeline.GesellschafterlistenDownloader")
-    def test_run_downloads_success(self, mock_downloader_cls, pipeline):
+    def test_run_downloads_success(self, mock_downloader_cls, pipeline, fake_pdf_bytes):
         """run_downloads processes companies and updates their status."""
-        from dk_downloader import DownloadResult
-
         # Insert a pending company
         pipeline.db.insert_company(
             Company(name="Download GmbH", register_num="HRB 88888", court="Berlin")
@@ -379,8 +423,7 @@ class TestRunDownloads:
         mock_instance = MagicMock()
         mock_downloader_cls.return_value = mock_instance
 
-        pdf_path = pipeline.pdf_dir / "test.pdf"
-        pdf_path.write_bytes(b"%PDF-1.4 test")
+        pdf_path = _make_pdf(pipeline, "test.pdf", fake_pdf_bytes)
 
         mock_instance.download.return_value = DownloadResult(
             success=True, pdf_path=pdf_path
@@ -396,8 +439,6 @@ class TestRunDownloads:
     @patch("pipeline.GesellschafterlistenDownloader")
     def test_run_downloads_no_gl(self, mock_downloader_cls, pipeline):
         """run_downloads handles 'no Gesellschafterliste available' result."""
-        from dk_downloader import DownloadResult
-
         pipeline.db.insert_company(
             Company(name="NoGL GmbH", register_num="HRB 11111")
         )
@@ -417,8 +458,6 @@ class TestRunDownloads:
     @patch("pipeline.GesellschafterlistenDownloader")
     def test_run_downloads_error(self, mock_downloader_cls, pipeline):
         """run_downloads handles download errors gracefully."""
-        from dk_downloader import DownloadResult
-
         pipeline.db.insert_company(
             Company(name="Error GmbH", register_num="HRB 22222")
         )
@@ -438,8 +477,6 @@ class TestRunDownloads:
     @patch("pipeline.GesellschafterlistenDownloader")
     def test_run_downloads_with_limit(self, mock_downloader_cls, pipeline):
         """run_downloads respects the limit parameter."""
-        from dk_downloader import DownloadResult
-
         for i in range(5):
             pipeline.db.insert_company(
                 Company(name=f"Firma {i}", register_num=f"HRB {5000 + i}")
@@ -469,18 +506,15 @@ class TestRunParsing:
         assert stats["parsed"] == 0
 
     @patch("pipeline.GesellschafterlisteParser")
-    def test_run_parsing_success(self, mock_parser_cls, pipeline):
+    def test_run_parsing_success(self, mock_parser_cls, pipeline, fake_pdf_bytes):
         """run_parsing processes PDFs and stores results."""
-        from pdf_parser import ParsingResult
-
         # Create a company that is downloaded but not parsed
         cid = pipeline.db.insert_company(
             Company(name="Parse GmbH", register_num="HRB 33333")
         )
 
         # Create a fake PDF file
-        pdf_file = pipeline.pdf_dir / "test_parse.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4 test")
+        pdf_file = _make_pdf(pipeline, "test_parse.pdf", fake_pdf_bytes)
         pipeline.db.update_download_status(cid, str(pdf_file), True)
 
         # Configure mock parser
@@ -501,6 +535,46 @@ class TestRunParsing:
         assert stats["parsed"] == 1
         assert stats["qualified"] == 1
 
+    @patch("pipeline.GesellschafterlisteParser")
+    def test_run_parsing_interrupt_keeps_parsed_results(self, mock_parser_cls, pipeline, fake_pdf_bytes):
+        """Results parsed before an interrupt are stored and logged consistently."""
+        for i in range(4):
+            cid = pipeline.db.insert_company(
+                Company(name=f"Abbruch {i} GmbH", register_num=f"HRB 5000{i}")
+            )
+            pdf_file = _make_pdf(pipeline, f"abort_{i}.pdf", fake_pdf_bytes)
+            pipeline.db.update_download_status(cid, str(pdf_file), True)
+
+        result = ParsingResult(
+            shareholders=[Shareholder(name="Max Mustermann", is_natural_person=True, source="table")],
+            natural_persons_count=1,
+            legal_entities_count=0,
+            confidence=0.9,
+        )
+        mock_parser_cls.return_value.parse.side_effect = [result, result, result, KeyboardInterrupt]
+
+        with pytest.raises(KeyboardInterrupt):
+            pipeline.run_parsing()
+
+        assert pipeline.db.get_stats()["parsed"] == 3
+        assert pipeline.db.scalar(
+            "SELECT COUNT(*) FROM pipeline_log WHERE stage = 'parse' AND status = 'success'"
+        ) == 3
+
+    def test_run_parsing_with_worker_pool(self, pipeline, fake_pdf_bytes):
+        """With workers > 1 every pending PDF is parsed in the pool and stored."""
+        for i in range(3):
+            cid = pipeline.db.insert_company(
+                Company(name=f"Pool {i} GmbH", register_num=f"HRB 4000{i}")
+            )
+            pdf_file = _make_pdf(pipeline, f"pool_{i}.pdf", fake_pdf_bytes)
+            pipeline.db.update_download_status(cid, str(pdf_file), True)
+
+        pipeline.run_parsing(workers=2)
+
+        stats = pipeline.db.get_stats()
+        assert stats["parsed"] == 3
+
 
 class TestPipelineIntegration:
     """Integration test: import -> mock parse -> export -> verify CSV."""
@@ -509,7 +583,7 @@ class TestPipelineIntegration:
     def pipeline(self, temp_pipeline):
         return temp_pipeline
 
-    def test_full_pipeline_flow(self, pipeline, sample_csv):
+    def test_full_pipeline_flow(self, pipeline, sample_csv, fake_pdf_bytes):
         """Full pipeline: import CSV, simulate download+parse, export, verify output."""
         # Step 1: Import
         pipeline.import_file(str(sample_csv))
@@ -520,8 +594,7 @@ class TestPipelineIntegration:
         companies = pipeline.db.get_pending_downloads()
         assert len(companies) == 3
 
-        pdf_file = pipeline.pdf_dir / "alpha.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4 fake content")
+        pdf_file = _make_pdf(pipeline, "alpha.pdf", fake_pdf_bytes)
 
         pipeline.db.update_download_status(companies[0].id, str(pdf_file), True)
         pipeline.db.log_event(companies[0].id, "download", "success")
@@ -575,12 +648,27 @@ class TestShowStats:
     def pipeline(self, temp_pipeline):
         return temp_pipeline
 
-    def test_show_stats_does_not_crash(self, pipeline, capsys):
+    def test_show_stats_does_not_crash(self, pipeline):
         """show_stats runs without error even on empty database."""
-        pipeline.show_stats()
-        captured = capsys.readouterr()
-        assert "GF-Screening Pipeline" in captured.out
-        assert "Firmen gesamt" in captured.out
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            pipeline.show_stats()
+
+        out = buf.getvalue()
+        assert "GF-Screening Pipeline" in out
+        assert "Firmen gesamt" in out
+
+
+class TestInit:
+    """Tests for pipeline construction."""
+
+    def test_default_db_path_under_base_dir(self, tmp_path):
+        """Without db_path the database file lives in base_dir/data."""
+        pipeline = GFScreeningPipeline(base_dir=tmp_path)
+        try:
+            assert (tmp_path / "data" / "gesellschafter.db").exists()
+        finally:
+            pipeline.close()
 
 
 class TestClose:
@@ -5,6 +5,7 @@ Tests cover: PDF cleanup, export cleanup, debug screenshot cleanup,
 full cleanup orchestration, dry-run mode, and CLI argument parsing.
 """
 
+import os
 import time
 from pathlib import Path
 
@@ -18,148 +19,152 @@ from retention import (
     run_full_cleanup,
 )
 
+# Reference mtimes in integer nanoseconds (os.utime(ns=...)), computed once
+# at import: 100 days is past the 90-day retention, 48 hours past the
+# 24-hour screenshot limit
+_NOW_NS = time.time_ns()
+_OLD_PDF_MTIME_NS = _NOW_NS - 100 * 86400 * 10**9
+_OLD_DEBUG_MTIME_NS = _NOW_NS - 48 * 3600 * 10**9
+
 
 class TestCleanupOldPdfs:
     """Tests for cleanup_old_pdfs function."""
 
-    def test_deletes_old_pdfs(self, tmp_path):
-        """PDFs older than max_age_days are deleted."""
+    @pytest.mark.parametrize("ext", ["pdf", "tif", "tiff"])
+    def test_deletes_old_media(self, tmp_path, aged_pdf_dir, ext):
+        """PDF, TIF and TIFF files older than max_age_days are deleted."""
         pdf_dir = tmp_path / "pdfs"
         pdf_dir.mkdir()
 
-        old_file = pdf_dir / "old.pdf"
-        old_file.write_bytes(b"%PDF-1.4 old")
-        # Set mtime to 100 days ago
-        old_mtime = time.time() - (100 * 86400)
-        import os
-        os.utime(old_file, (old_mtime, old_mtime))
+        # Hardlink keeps the 100-day-old mtime of the reference file
+        old_file = pdf_dir / f"old.{ext}"
+        os.link(aged_pdf_dir / old_file.name, old_file)
 
         deleted = cleanup_old_pdfs(pdf_dir, max_age_days=90)
         assert deleted == 1
         assert not old_file.exists()
 
-    def test_keeps_recent_pdfs(self, tmp_path):
-        """PDFs newer than max_age_days are kept."""
+    def test_ignores_non_matching_files(self, tmp_path):
+        """Files with other extensions are not deleted."""
         pdf_dir = tmp_path / "pdfs"
         pdf_dir.mkdir()
 
-        new_file = pdf_dir / "new.pdf"
-        new_file.write_bytes(b"%PDF-1.4 new")
+        txt_file = pdf_dir / "notes.txt"
+        txt_file.touch()
+        os.utime(txt_file, ns=(_OLD_PDF_MTIME_NS, _OLD_PDF_MTIME_NS))
 
         deleted = cleanup_old_pdfs(pdf_dir, max_age_days=90)
         assert deleted == 0
-        assert new_file.exists()
+        assert txt_file.exists()
 
-    def test_deletes_tif_files(self, tmp_path):
-        """TIF and TIFF files are also cleaned up."""
+    def test_skips_matching_directories(self, tmp_path):
+        """A subdirectory named like a PDF is neither counted nor removed."""
         pdf_dir = tmp_path / "pdfs"
-        pdf_dir.mkdir()
-
-        import os
-        old_mtime = time.time() - (100 * 86400)
-
-        for ext in ("tif", "tiff"):
-            f = pdf_dir / f"scan.{ext}"
-            f.write_bytes(b"TIFF data")
-            os.utime(f, (old_mtime, old_mtime))
+        sub = pdf_dir / "archive.pdf"
+        sub.mkdir(parents=True)
+        os.utime(sub, ns=(_OLD_PDF_MTIME_NS, _OLD_PDF_MTIME_NS))
 
         deleted = cleanup_old_pdfs(pdf_dir, max_age_days=90)
-        assert deleted == 2
-
-    def test_nonexistent_dir_returns_zero(self, tmp_path):
-        """Non-existent directory returns 0 without error."""
-        deleted = cleanup_old_pdfs(tmp_path / "nonexistent", max_age_days=90)
         assert deleted == 0
+        assert sub.is_dir()
 
-    def test_ignores_non_matching_files(self, tmp_path):
-        """Files with other extensions are not deleted."""
+    @pytest.mark.stress
+    def test_bulk_deletion(self, tmp_path, aged_file):
+        """10,000 old files are deleted in one pass within a few seconds."""
         pdf_dir = tmp_path / "pdfs"
         pdf_dir.mkdir()
+        for i in range(10_000):
+            aged_file(pdf_dir / f"f{i}.pdf", _OLD_PDF_MTIME_NS)
 
-        import os
-        old_mtime = time.time() - (100 * 86400)
-
-        txt_file = pdf_dir / "notes.txt"
-        txt_file.write_text("not a pdf")
-        os.utime(txt_file, (old_mtime, old_mtime))
-
-        deleted = cleanup_old_pdfs(pdf_dir, max_age_days=90)
-        assert deleted == 0
-        assert txt_file.exists()
+        t0 = time.monotonic()
+        assert cleanup_old_pdfs(pdf_dir, max_age_days=90) == 10_000
+        assert time.monotonic() - t0 < 5.0
+        assert not any(pdf_dir.iterdir())
 
 
 class TestCleanupOldExports:
     """Tests for cleanup_old_exports function."""
 
-    def test_deletes_old_csvs(self, tmp_path):
+    def test_deletes_old_csvs(self, tmp_path, aged_file):
         """CSV files older than max_age_days are deleted."""
-        import os
-        old_mtime = time.time() - (100 * 86400)
-
-        csv_file = tmp_path / "export.csv"
-        csv_file.write_text("header\ndata")
-        os.utime(csv_file, (old_mtime, old_mtime))
+        aged_file(tmp_path / "export.csv", _OLD_PDF_MTIME_NS)
 
         deleted = cleanup_old_exports(tmp_path, max_age_days=90)
         assert deleted == 1
 
-    def test_keeps_recent_csvs(self, tmp_path):
-        """Recent CSV files are kept."""
-        csv_file = tmp_path / "export.csv"
-        csv_file.write_text("header\ndata")
-
-        deleted = cleanup_old_exports(tmp_path, max_age_days=90)
-        assert deleted == 0
-        assert csv_file.exists()
-
-    def test_nonexistent_dir(self, tmp_path):
-        """Non-existent directory returns 0."""
-        deleted = cleanup_old_exports(tmp_path / "nonexistent")
-        assert deleted == 0
-
 
 class TestCleanupDebugScreenshots:
     """Tests for cleanup_debug_screenshots function."""
 
-    def test_deletes_old_screenshots(self, tmp_path):
+    def test_deletes_old_screenshots(self, tmp_path, aged_file):
         """Debug screenshots older than max_age_hours are deleted."""
-        import os
-        old_mtime = time.time() - (48 * 3600)  # 48 hours ago
-
-        screenshot = tmp_path / "debug_01_search.png"
-        screenshot.write_bytes(b"PNG data")
-        os.utime(screenshot, (old_mtime, old_mtime))
+        aged_file(tmp_path / "debug_01_search.png", _OLD_DEBUG_MTIME_NS)
 
         deleted = cleanup_debug_screenshots(tmp_path, max_age_hours=24)
         assert deleted == 1
 
-    def test_keeps_recent_screenshots(self, tmp_path):
-        """Recent debug screenshots are kept."""
-        screenshot = tmp_path / "debug_01_search.png"
-        screenshot.write_bytes(b"PNG data")
-
-        deleted = cleanup_debug_screenshots(tmp_path, max_age_hours=24)
-        assert deleted == 0
-        assert screenshot.exists()
-
     def test_only_matches_debug_prefix(self, tmp_path):
         """Only files matching debug_*.png pattern are deleted."""
-        import os
-        old_mtime = time.time() - (48 * 3600)
-
         # This should NOT be deleted (wrong prefix)
         other = tmp_path / "screenshot.png"
-        other.write_bytes(b"PNG data")
-        os.utime(other, (old_mtime, old_mtime))
+        other.touch()
+        os.utime(other, ns=(_OLD_DEBUG_MTIME_NS, _OLD_DEBUG_MTIME_NS))
 
         deleted = cleanup_debug_screenshots(tmp_path, max_age_hours=24)
         assert deleted == 0
         assert other.exists()
 
-    def test_nonexistent_dir(self, tmp_path):
-        """Non-existent directory returns 0."""
-        deleted = cleanup_debug_screenshots(tmp_path / "nonexistent")
-        assert deleted == 0
+
+class TestAllCleanupFunctions:
+    """Tests shared by all three cleanup functions."""
+
+    @pytest.mark.parametrize(
+        "func,fname,kwargs",
+        [
+            (cleanup_old_pdfs, "new.pdf", {"max_age_days": 90}),
+            (cleanup_old_exports, "new.csv", {"max_age_days": 90}),
+            (cleanup_debug_screenshots, "debug_new.png", {"max_age_hours": 24}),
+        ],
+        ids=["pdfs", "exports", "debug"],
+    )
+    def test_keeps_recent(self, tmp_path, func, fname, kwargs):
+        """Files newer than the cutoff are kept."""
+        recent = tmp_path / fname
+        recent.touch()
+
+        assert func(tmp_path, **kwargs) == 0
+        assert recent.exists()
+
+    @pytest.mark.parametrize(
+        "func,kwargs",
+        [
+            (cleanup_old_pdfs, {"max_age_days": 90}),
+            (cleanup_old_exports, {}),
+            (cleanup_debug_screenshots, {}),
+        ],
+        ids=["pdfs", "exports", "debug"],
+    )
+    def test_nonexistent_dir_returns_zero(self, tmp_path, func, kwargs):
+        """Non-existent directory returns 0 without error."""
+        assert func(tmp_path / "nonexistent", **kwargs) == 0
+
+
+# One stale file per cleanup category, relative to the project root
+_FULL_LAYOUT = {
+    "pdfs/old.pdf": _OLD_PDF_MTIME_NS,
+    "output/old.csv": _OLD_PDF_MTIME_NS,
+    "debug/debug_01.png": _OLD_DEBUG_MTIME_NS,
+}
+
+
+@pytest.fixture
+def full_layout(tmp_path, aged_file):
+    """Project root in tmp_path populated with _FULL_LAYOUT."""
+    for rel, mtime_ns in _FULL_LAYOUT.items():
+        path = tmp_path / rel
+        path.parent.mkdir(exist_ok=True)
+        aged_file(path, mtime_ns)
+    return tmp_path
 
 
 class TestRunFullCleanup:
@@ -173,54 +178,19 @@ class TestRunFullCleanup:
         assert "exports" in results
         assert "debug" in results
 
-    def test_full_cleanup_deletes_across_dirs(self, tmp_path):
+    def test_full_cleanup_deletes_across_dirs(self, full_layout):
         """run_full_cleanup processes all three directories."""
-        import os
-        old_mtime = time.time() - (100 * 86400)
+        results = run_full_cleanup(full_layout, max_age_days=90)
 
-        # Create directories
-        pdf_dir = tmp_path / "pdfs"
-        pdf_dir.mkdir()
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        debug_dir = tmp_path / "debug"
-        debug_dir.mkdir()
-
-        # Create old files in each
-        pdf = pdf_dir / "old.pdf"
-        pdf.write_bytes(b"%PDF old")
-        os.utime(pdf, (old_mtime, old_mtime))
-
-        csv = output_dir / "old.csv"
-        csv.write_text("data")
-        os.utime(csv, (old_mtime, old_mtime))
-
-        debug_mtime = time.time() - (48 * 3600)
-        screenshot = debug_dir / "debug_01.png"
-        screenshot.write_bytes(b"PNG")
-        os.utime(screenshot, (debug_mtime, debug_mtime))
-
-        results = run_full_cleanup(tmp_path, max_age_days=90)
-
-        assert results["pdfs"] == 1
-        assert results["exports"] == 1
-        assert results["debug"] == 1
+        assert results == {"pdfs": 1, "exports": 1, "debug": 1}
+        assert not any((full_layout / rel).exists() for rel in _FULL_LAYOUT)
 
-    def test_dry_run_does_not_delete(self, tmp_path):
+    def test_dry_run_does_not_delete(self, full_layout):
         """Dry run counts but does not delete files."""
-        import os
-        old_mtime = time.time() - (100 * 86400)
-
-        pdf_dir = tmp_path / "pdfs"
-        pdf_dir.mkdir()
-        pdf = pdf_dir / "old.pdf"
-        pdf.write_bytes(b"%PDF old")
-        os.utime(pdf, (old_mtime, old_mtime))
-
-        results = run_full_cleanup(tmp_path, max_age_days=90, dry_run=True)
+        results = run_full_cleanup(full_layout, max_age_days=90, dry_run=True)
 
-        assert results["pdfs"] == 1
-        assert pdf.exists()  # File still there
+        assert results == {"pdfs": 1, "exports": 1, "debug": 1}
+        assert all((full_layout / rel).exists() for rel in _FULL_LAYOUT)
 
     def test_empty_dirs_no_errors(self, tmp_path):
         """Empty directories produce zero counts without errors."""